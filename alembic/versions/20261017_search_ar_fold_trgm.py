@@ -0,0 +1,81 @@
+"""Add trigram indexes on Arabic-folded search expressions.
+
+/v1/search now folds Arabic letter variants (أ/إ/آ/ٱ → ا, ى → ي, ة → ه,
+tatweel removed) on the column side so they compare against the normalized
+query. These indexes cover the exact folded expressions used by
+app/api/search.py (_ar_fold_sql) so the LIKE / % gates stay index-backed.
+
+Nothing queries the plain lower(col) form of the suhail street, neighborhood
+and municipality names any more, so the trigram indexes built on it by
+earlier migrations (including the duplicate pair from 20260201) are dropped
+once the folded replacements exist; downgrade restores them.
+
+Revision ID: 20261017_search_ar_fold_trgm
+Revises: 20260501b_drop_osm_districts
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+revision = "20261017_search_ar_fold_trgm"
+down_revision = "20260501b_drop_osm_districts"
+branch_labels = None
+depends_on = None
+
+_FOLD = "translate(lower({expr}), 'أإآٱىةـ', 'اااايه')"
+
+# Superseded lower(col) trigram indexes on suhail_parcels_mat: (index, column).
+_LOWER_TRGM_INDEXES = (
+    ("ix_suhail_parcels_mat_street_name_trgm", "street_name"),
+    ("ix_suhail_parcels_mat_neighborhood_name_trgm", "neighborhood_name"),
+    ("ix_suhail_parcels_mat_municipality_name_trgm", "municipality_name"),
+    ("ix_suhail_parcels_neighborhood_trgm", "neighborhood_name"),
+    ("ix_suhail_parcels_municipality_trgm", "municipality_name"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        conn = op.get_bind()
+        if conn.execute(text("SELECT to_regclass('public.external_feature')")).scalar():
+            district_expr = _FOLD.format(
+                expr="COALESCE(properties->>'district_raw', properties->>'name', properties->>'district')"
+            )
+            op.execute(
+                f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_external_feature_district_fold_trgm
+                    ON public.external_feature USING gin (({district_expr}) gin_trgm_ops)
+                    WHERE layer_name = 'aqar_district_hulls';
+                """
+            )
+        if conn.execute(text("SELECT to_regclass('public.suhail_parcels_mat')")).scalar():
+            for column in ("street_name", "neighborhood_name", "municipality_name"):
+                op.execute(
+                    f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_suhail_parcels_mat_{column}_fold_trgm
+                        ON public.suhail_parcels_mat USING gin (({_FOLD.format(expr=column)}) gin_trgm_ops);
+                    """
+                )
+            for index_name, _column in _LOWER_TRGM_INDEXES:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name};")
+
+
+def downgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        conn = op.get_bind()
+        if conn.execute(text("SELECT to_regclass('public.suhail_parcels_mat')")).scalar():
+            for index_name, column in _LOWER_TRGM_INDEXES:
+                op.execute(
+                    f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                        ON public.suhail_parcels_mat USING gin (lower({column}) gin_trgm_ops);
+                    """
+                )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_suhail_parcels_mat_municipality_name_fold_trgm;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_suhail_parcels_mat_neighborhood_name_fold_trgm;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_suhail_parcels_mat_street_name_fold_trgm;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_external_feature_district_fold_trgm;")
@@ -0,0 +1,46 @@
+"""Add amenity indexes for category-mode POI search.
+
+The /v1/search POI statements match ``lower(name)`` (trigram-indexed) OR
+``amenity = ANY(:poi_amenities)`` for category queries such as "cafe" or
+"مطعم". Without an index on ``amenity`` that OR cannot become a BitmapOr,
+so every category query falls back to a sequential scan of the whole table.
+
+The similarity scoring expression (lower(COALESCE(name, amenity, ...))) is
+only evaluated on rows that already passed these filters, so it gets no
+index of its own. District labels are covered by the folded expression
+index from 20261017_search_ar_fold_trgm.
+
+Revision ID: 20261017b_search_poi_amenity_idx
+Revises: 20261017_search_ar_fold_trgm
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+revision = "20261017b_search_poi_amenity_idx"
+down_revision = "20261017_search_ar_fold_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        conn = op.get_bind()
+        for table in ("planet_osm_point", "planet_osm_polygon"):
+            if conn.execute(text(f"SELECT to_regclass('public.{table}')")).scalar():
+                op.execute(
+                    f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_amenity
+                        ON public.{table} (amenity)
+                        WHERE amenity IS NOT NULL;
+                    """
+                )
+
+
+def downgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_planet_osm_polygon_amenity;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_planet_osm_point_amenity;")
@@ -0,0 +1,38 @@
+"""Add a plan/block/parcel btree index for exact parcel search.
+
+/v1/search issues a separate equality statement when the query carries a full
+plan/block/parcel triple (``plan_number = :plan AND block_number = :block AND
+parcel_number = :parcel``). This composite index turns that into an index seek
+instead of scanning suhail_parcels_mat.
+
+Revision ID: 20261017c_suhail_parcel_triple_idx
+Revises: 20261017b_search_poi_amenity_idx
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+revision = "20261017c_suhail_parcel_triple_idx"
+down_revision = "20261017b_search_poi_amenity_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        conn = op.get_bind()
+        if conn.execute(text("SELECT to_regclass('public.suhail_parcels_mat')")).scalar():
+            op.execute(
+                """
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_suhail_parcels_mat_plan_block_parcel
+                    ON public.suhail_parcels_mat (plan_number, block_number, parcel_number);
+                """
+            )
+
+
+def downgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_suhail_parcels_mat_plan_block_parcel;")
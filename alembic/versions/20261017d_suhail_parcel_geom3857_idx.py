@@ -0,0 +1,43 @@
+"""Add a Web Mercator expression GiST index for Suhail parcel tiles.
+
+The /v1/tiles/suhail statements filter candidates with
+``ST_Transform(p.geom, 3857) && t.geom3857`` so the bbox test and the clip run
+in the tile's CRS. The existing GiST indexes cover ``geom`` (4326) and
+``geom_32638`` only, so that filter transformed every parcel in the view before
+comparing. An index on the same expression lets the planner answer it with an
+index scan and only transform the parcels inside the tile.
+
+suhail_parcels_mat is a materialized view, so a stored generated column is not
+an option; the expression index is refreshed with the view.
+
+Revision ID: 20261017d_suhail_parcel_geom3857_idx
+Revises: 20261017c_suhail_parcel_triple_idx
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+revision = "20261017d_suhail_parcel_geom3857_idx"
+down_revision = "20261017c_suhail_parcel_triple_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        conn = op.get_bind()
+        if conn.execute(text("SELECT to_regclass('public.suhail_parcels_mat')")).scalar():
+            op.execute(
+                """
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS suhail_parcels_mat_geom_3857_gix
+                    ON public.suhail_parcels_mat USING GIST (ST_Transform(geom, 3857));
+                """
+            )
+
+
+def downgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS suhail_parcels_mat_geom_3857_gix;")
@@ -0,0 +1,54 @@
+"""Use SP-GiST for the Suhail parcel tile bbox index.
+
+20261017d_suhail_parcel_geom3857_idx indexed ``ST_Transform(geom, 3857)`` with
+GiST for the tile filter ``ST_Transform(p.geom, 3857) && tile``. That index only
+serves that bbox test, and cadastral parcels barely overlap. For this kind of
+data, SP-GiST's space-partitioned boxes are smaller and at least as fast, so
+more of the index stays in shared_buffers during tile bursts. The SP-GiST index
+is built first, and the GiST one is dropped only after it exists.
+
+overture_buildings keeps its index: no tile route reads it, and its only
+spatial queries (restaurant scoring) are geography ST_DWithin radius searches
+served by idx_overture_buildings_geog_4326 from 0016. SP-GiST has no geography
+operator class, so that index cannot be converted.
+
+Revision ID: 20261017e_suhail_parcel_geom3857_spgist
+Revises: 20261017d_suhail_parcel_geom3857_idx
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+revision = "20261017e_suhail_parcel_geom3857_spgist"
+down_revision = "20261017d_suhail_parcel_geom3857_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        conn = op.get_bind()
+        if conn.execute(text("SELECT to_regclass('public.suhail_parcels_mat')")).scalar():
+            op.execute(
+                """
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS suhail_parcels_mat_geom_3857_spgix
+                    ON public.suhail_parcels_mat USING SPGIST (ST_Transform(geom, 3857));
+                """
+            )
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS suhail_parcels_mat_geom_3857_gix;")
+
+
+def downgrade() -> None:
+    ctx = op.get_context()
+    with ctx.autocommit_block():
+        conn = op.get_bind()
+        if conn.execute(text("SELECT to_regclass('public.suhail_parcels_mat')")).scalar():
+            op.execute(
+                """
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS suhail_parcels_mat_geom_3857_gix
+                    ON public.suhail_parcels_mat USING GIST (ST_Transform(geom, 3857));
+                """
+            )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS suhail_parcels_mat_geom_3857_spgix;")
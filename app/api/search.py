@@ -1,24 +1,53 @@
+import heapq
 import logging
 import math
 import re
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from typing import Any
 from urllib.parse import unquote
 
+import numpy as np
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy import text
+from sqlalchemy import Float, Integer, String, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db import session as db_session
 from app.db.deps import get_db
 from app.api.tiles import PARCEL_TILE_TABLE, SUHAIL_PARCEL_TABLE
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-_TABLE_CACHE: dict[str, bool] = {}
-_COLUMN_CACHE: dict[str, set[str]] = {}
+_MISSING = object()
+
+
+# Schema lookups expire so DDL changes (new columns, dropped tables) are picked up
+# without a restart; both stay bounded.
+_TABLE_CACHE = TTLCache(maxsize=256, ttl=600)
+# Missing tables are remembered only briefly, so a table created by a migration or
+# ingest run is picked up within a minute while requests stop re-probing absent ones
+# (e.g. search_index_mat on deployments without it) on every call.
+_TABLE_ABSENT_CACHE = TTLCache(maxsize=256, ttl=60)
+# Every table the /v1/search index and legacy paths may read; parcel tables are added per call.
+_SEARCH_TABLES = (
+    "public.search_index_mat",
+    "public.planet_osm_point",
+    "public.planet_osm_polygon",
+    "public.planet_osm_line",
+    "public.external_feature",
+)
+_COLUMN_CACHE = TTLCache(maxsize=256, ttl=600)
 _RIYADH_BBOX = {
     "min_lon": 46.20,
     "min_lat": 24.20,
@@ -31,11 +60,16 @@ _WGS84_LON_MAX = 180.0
 _WGS84_LAT_MIN = -90.0
 _WGS84_LAT_MAX = 90.0
 
-_AR_DIACRITICS = re.compile(
-    r"[\u0610-\u061A\u064B-\u065F\u06D6-\u06DC\u06DF-\u06E8\u06EA-\u06ED]"
+# Arabic diacritic ranges (inclusive); deleted by the normalization translate table.
+_AR_DIACRITIC_RANGES = (
+    (0x0610, 0x061A),
+    (0x064B, 0x065F),
+    (0x06D6, 0x06DC),
+    (0x06DF, 0x06E8),
+    (0x06EA, 0x06ED),
 )
-_PUNCTUATION_RE = re.compile(r"[،,;؛/\\\|:\uFF1A\u2013\u2014\-\(\)\[\]\{\}\.\+]+")
-_EXTRA_PUNCTUATION_RE = re.compile(r"[!\"'`~@#$%^&*_=+<>?\u2026]+")
+# Separators and symbols that become a single space (one class, so one regex pass).
+_PUNCTUATION_RE = re.compile(r"[،,;؛/\\\|:\uFF1A\u2013\u2014\-\(\)\[\]\{\}\.\+!\"'`~@#$%^&*_=<>?\u2026]+")
 _ARABIC_DIGIT_MAP = str.maketrans(
     {
         "٠": "0",
@@ -62,10 +96,69 @@ _ARABIC_DIGIT_MAP = str.maketrans(
 )
 _ALEF_VARIANTS = str.maketrans({"أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا", "ى": "ي"})
 _TA_MARBUTA_VARIANT = str.maketrans({"ة": "ه"})
+# NBSP, digits, alef/ya variants, tatweel and diacritic removal folded into one
+# str.translate() pass. Every mapping is per code point and no replacement is itself
+# a diacritic, so this is equivalent to the old sequential replace/translate/sub passes.
+_NORMALIZE_KEEP_TA_MARBUTA = {
+    0x00A0: " ",
+    **_ARABIC_DIGIT_MAP,
+    **_ALEF_VARIANTS,
+    ord("ـ"): None,
+    **{code: None for start, end in _AR_DIACRITIC_RANGES for code in range(start, end + 1)},
+}
+_NORMALIZE_TABLE = {**_NORMALIZE_KEEP_TA_MARBUTA, **_TA_MARBUTA_VARIANT}
+# Column-side mirror of the alef/ya/ta-marbuta folding (and tatweel removal) that
+# normalize_search_text() applies to the query. The trailing tatweel in _FROM has no
+# counterpart in _TO, so translate() deletes it. Keep in sync with the
+# 20261017_search_ar_fold_trgm expression indexes.
+_AR_FOLD_SQL_FROM = "أإآٱىةـ"
+_AR_FOLD_SQL_TO = "اااايه"
+
+# Queries shorter than this produce no usable trigrams; a bare "%ab%" LIKE then scans
+# and similarity-sorts most of planet_osm_point/polygon.
+_MIN_TRIGRAM_QUERY_LEN = 3
+# Normalized queries shorter than this (e.g. "a-" or a lone Arabic letter) are
+# typeahead noise: answer them without touching the database.
+_MIN_SEARCH_QUERY_LEN = 2
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PLAIN_ASCII_RE = re.compile(r"[A-Za-z0-9 ]+")
+_DIGIT_RUN_RE = re.compile(r"\d+")
+_PARCEL_TRIPLE_RE = re.compile(r"(\d+)\s*[-/]\s*(\d+)\s*[-/]\s*(\d+)")
+
+# Bare "lat,lon" pairs plus the Google Maps "@lat,lon" and "?q=lat,lon" URL forms, in one scan.
+_COORDS_RE = re.compile(
+    r"(?:(?P<at>@)|(?P<param>[?&#](?:q|query|ll)=))?"
+    r"(?P<lat>-?\d+(?:\.\d+)?)\s*,\s*(?P<lon>-?\d+(?:\.\d+)?)"
+)
 
-_COORD_PAIR_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)")
-_GOOGLE_MAPS_AT_RE = re.compile(r"@(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?)")
-_GOOGLE_MAPS_Q_RE = re.compile(r"[?&#](?:q|query|ll)=(-?\d+(?:\.\d+)?),\s*(-?\d+(?:\.\d+)?)")
+
+# Explicit types for every bind parameter the search statements use, so SQLAlchemy
+# doesn't infer them from Python values on each execute and Postgres gets typed
+# parameters (notably an empty poi_amenities list, which is otherwise untyped).
+_SEARCH_BIND_TYPES = {
+    "q_raw_lower": String(),
+    "q_like_lower": String(),
+    "limit": Integer(),
+    "min_lon": Float(),
+    "min_lat": Float(),
+    "max_lon": Float(),
+    "max_lat": Float(),
+    "has_viewport": Integer(),
+    "poi_amenities": ARRAY(String()),
+    "plan": String(),
+    "block": String(),
+    "parcel": String(),
+    "source_label": String(),
+}
+
+
+def _search_text(sql: str) -> TextClause:
+    """text() for a search statement, with its known bind parameters typed."""
+    clause = text(sql)
+    return clause.bindparams(
+        *(bindparam(name, type_=_SEARCH_BIND_TYPES[name]) for name in clause._bindparams if name in _SEARCH_BIND_TYPES)
+    )
 
 
 class SearchItem(BaseModel):
@@ -85,6 +178,8 @@ def _table_exists(db: Session, table_name: str) -> bool:
     cached = _TABLE_CACHE.get(table_name)
     if cached is not None:
         return cached
+    if table_name in _TABLE_ABSENT_CACHE:
+        return False
     try:
         row = db.execute(text("SELECT to_regclass(:table_name)"), {"table_name": table_name}).scalar()
         exists = row is not None
@@ -92,12 +187,55 @@ def _table_exists(db: Session, table_name: str) -> bool:
         logger.warning("Search table lookup failed for %s: %s", table_name, exc)
         # Do NOT cache failures; allow recovery after transient DB errors.
         return False
-    # Only cache positive existence. Negative results can change after migrations/ingest.
+    # Negative results can change after migrations/ingest, so they expire sooner.
     if exists:
         _TABLE_CACHE[table_name] = True
+    else:
+        _TABLE_ABSENT_CACHE[table_name] = True
     return exists
 
 
+def _prewarm_tables(db: Session, table_names: list[str]) -> dict[str, bool]:
+    """
+    Resolve several to_regclass() lookups in one round-trip. Returns what is known for
+    this request; results are cached exactly as _table_exists() caches them.
+    On failure an empty dict is returned so callers fall back to _table_exists().
+    """
+    names = list(dict.fromkeys(table_names))
+    known = {name: True for name in names if _TABLE_CACHE.get(name)}
+    known.update({name: False for name in names if name not in known and name in _TABLE_ABSENT_CACHE})
+    missing = [name for name in names if name not in known]
+    if not missing:
+        return known
+    try:
+        rows = db.execute(
+            text(
+                """
+                SELECT t, to_regclass(t) IS NOT NULL
+                FROM unnest(CAST(:tables AS text[])) AS t
+                """
+            ),
+            {"tables": missing},
+        ).all()
+    except SQLAlchemyError as exc:
+        logger.warning("Search table prewarm failed for %s: %s", missing, exc)
+        # Do NOT cache failures; allow recovery after transient DB errors.
+        return {}
+    for name, exists in rows:
+        known[name] = bool(exists)
+        # Negative results can change after migrations/ingest, so they expire sooner.
+        if exists:
+            _TABLE_CACHE[name] = True
+        else:
+            _TABLE_ABSENT_CACHE[name] = True
+    return known
+
+
+def _table_known(db: Session, table_name: str, tables_present: dict[str, bool] | None) -> bool:
+    present = (tables_present or {}).get(table_name)
+    return present if present is not None else _table_exists(db, table_name)
+
+
 def _split_table_name(table_name: str) -> tuple[str, str]:
     if "." in table_name:
         schema_name, table = table_name.split(".", 1)
@@ -105,7 +243,7 @@ def _split_table_name(table_name: str) -> tuple[str, str]:
     return "public", table_name
 
 
-def _table_columns(db: Session, table_name: str) -> set[str]:
+def _table_columns(db: Session, table_name: str) -> frozenset[str]:
     cached = _COLUMN_CACHE.get(table_name)
     if cached is not None:
         return cached
@@ -121,17 +259,64 @@ def _table_columns(db: Session, table_name: str) -> set[str]:
                 """
             ),
             {"schema": schema_name, "table": table},
-        ).mappings()
-        columns = {row["column_name"] for row in rows}
+        ).scalars()
+        columns = frozenset(rows)
     except SQLAlchemyError as exc:
         logger.warning("Search column lookup failed for %s: %s", table_name, exc)
         # Do NOT cache failures; allow recovery after transient DB errors.
-        return set()
+        return frozenset()
     # Cache successful results (even if empty — table may legitimately have no columns we use)
     _COLUMN_CACHE[table_name] = columns
     return columns
 
 
+def _prewarm_columns(db: Session, table_names: list[str]) -> None:
+    """
+    Populate _COLUMN_CACHE for several tables with one information_schema round-trip
+    instead of one query per table. Only pass tables known to exist: an empty column
+    set is cached just like _table_columns() does.
+    """
+    missing = [name for name in dict.fromkeys(table_names) if name not in _COLUMN_CACHE]
+    if not missing:
+        return
+    pairs = [_split_table_name(name) for name in missing]
+    try:
+        rows = db.execute(
+            text(
+                """
+                SELECT table_schema, table_name, column_name
+                FROM information_schema.columns
+                WHERE (table_schema, table_name) IN (
+                    SELECT * FROM unnest(CAST(:schemas AS text[]), CAST(:tables AS text[]))
+                )
+                """
+            ),
+            {"schemas": [schema for schema, _ in pairs], "tables": [table for _, table in pairs]},
+        ).all()
+    except SQLAlchemyError as exc:
+        logger.warning("Search column prewarm failed for %s: %s", missing, exc)
+        # Do NOT cache failures; _table_columns() retries per table.
+        return
+    found: dict[tuple[str, str], set[str]] = {pair: set() for pair in pairs}
+    for schema_name, table, column_name in rows:
+        found.setdefault((schema_name, table), set()).add(column_name)
+    for name, pair in zip(missing, pairs):
+        _COLUMN_CACHE[name] = frozenset(found[pair])
+
+
+def clear_search_catalog_cache() -> None:
+    """
+    Forget cached table existence, column sets, the SQL built from them and cached
+    responses. Call after migrations or ingest change the search tables, and between tests.
+    """
+    _TABLE_CACHE.clear()
+    _TABLE_ABSENT_CACHE.clear()
+    _COLUMN_CACHE.clear()
+    _ROAD_SQL_CACHE.clear()
+    _PARCEL_SQL_CACHE.clear()
+    _SEARCH_RESPONSE_CACHE.clear()
+
+
 @router.get("/search/diag")
 def search_diag(db: Session = Depends(get_db)) -> dict[str, Any]:
     """
@@ -159,50 +344,69 @@ def search_diag(db: Session = Depends(get_db)) -> dict[str, Any]:
 def normalize_search_text(q: str, *, replace_ta_marbuta: bool = True) -> str:
     if not q:
         return ""
-    normalized = unquote(q).replace("\u00A0", " ").strip()
+    return _normalize_search_text_cached(q, replace_ta_marbuta)
+
+
+# Pure function of its inputs; typeahead sends the same prefixes (and ranking re-normalizes
+# the same labels) over and over, so memoize with a bounded LRU.
+@lru_cache(maxsize=4096)
+def _normalize_search_text_cached(q: str, replace_ta_marbuta: bool) -> str:
+    # str.strip() already drops a leading/trailing NBSP; inner ones go through the table.
+    normalized = unquote(q).strip()
     if not normalized:
         return ""
-    normalized = normalized.replace("ـ", "")
-    normalized = _AR_DIACRITICS.sub("", normalized)
-    normalized = normalized.translate(_ARABIC_DIGIT_MAP)
-    normalized = normalized.translate(_ALEF_VARIANTS)
-    if replace_ta_marbuta:
-        normalized = normalized.translate(_TA_MARBUTA_VARIANT)
+    if _PLAIN_ASCII_RE.fullmatch(normalized):
+        # Nothing below can change plain ASCII letters/digits; only collapse spaces.
+        return _WHITESPACE_RE.sub(" ", normalized)
+    normalized = normalized.translate(_NORMALIZE_TABLE if replace_ta_marbuta else _NORMALIZE_KEEP_TA_MARBUTA)
     normalized = _PUNCTUATION_RE.sub(" ", normalized)
-    normalized = _EXTRA_PUNCTUATION_RE.sub(" ", normalized)
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = _WHITESPACE_RE.sub(" ", normalized).strip()
     return normalized
 
 
+def _ar_fold_sql(expr: str) -> str:
+    """
+    SQL fragment that lowercases and folds Arabic letter variants of ``expr`` so that
+    column values compare against the already-normalized query (e.g. "مدرسة" vs "مدرسه").
+    """
+    return f"translate(lower({expr}), '{_AR_FOLD_SQL_FROM}', '{_AR_FOLD_SQL_TO}')"
+
+
 # --- Search intent-word stripping (per-type "core query") ---
 # This fixes cases like "حي النرجس" failing to match district label "النرجس",
 # and "شارع الملك" failing when stored name doesn't include the prefix.
-_DISTRICT_INTENT_WORDS = {
-    # Arabic
-    "حي",
-    "حى",
-    # English
-    "district",
-    "neighborhood",
-    "neighbourhood",
-    "hood",
-}
+_DISTRICT_INTENT_WORDS = frozenset(
+    {
+        # Arabic
+        "حي",
+        "حى",
+        # English
+        "district",
+        "neighborhood",
+        "neighbourhood",
+        "hood",
+    }
+)
 
-_ROAD_INTENT_WORDS = {
-    # Arabic
-    "شارع",
-    "طريق",
-    # English (common user prefixes)
-    "road",
-    "street",
-    "st",
-    "rd",
-    "avenue",
-    "ave",
-}
+_ROAD_INTENT_WORDS = frozenset(
+    {
+        # Arabic
+        "شارع",
+        "طريق",
+        # English (common user prefixes)
+        "road",
+        "street",
+        "st",
+        "rd",
+        "avenue",
+        "ave",
+    }
+)
 
 
-def _strip_intent_words(normalized_lower: str, intent_words: set[str]) -> str:
+# Typeahead re-sends the same prefixes; the word sets are frozensets so they hash.
+@lru_cache(maxsize=4096)
+def _strip_intent_words(normalized_lower: str, intent_words: frozenset[str]) -> str:
     """
     Remove standalone intent words from a *normalized lowercase* query.
     Keeps the original query if stripping would result in empty.
@@ -242,75 +446,105 @@ _POI_AMENITY_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+_POI_KEYWORD_SET = frozenset(_POI_AMENITY_KEYWORDS)
+
+
 def _poi_amenity_values_for_query(normalized_lower: str) -> list[str]:
     """
     If query looks like a category keyword, return amenity values to match.
     Otherwise return empty list.
     """
-    if not normalized_lower:
+    if len(normalized_lower) < _MIN_SEARCH_QUERY_LEN:
         return []
+    # Copy so callers can't mutate the cached value.
+    return list(_poi_amenity_values_cached(normalized_lower))
+
+
+@lru_cache(maxsize=4096)
+def _poi_amenity_values_cached(normalized_lower: str) -> tuple[str, ...]:
+    # Keywords are single tokens, so a whole-query match is just the one-token case.
     tokens = normalized_lower.split()
-    values: list[str] = []
-    if normalized_lower in _POI_AMENITY_KEYWORDS:
-        values.extend(_POI_AMENITY_KEYWORDS[normalized_lower])
-    else:
-        for token in tokens:
-            if token in _POI_AMENITY_KEYWORDS:
-                values.extend(_POI_AMENITY_KEYWORDS[token])
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        ordered.append(value)
-    return ordered
+    if _POI_KEYWORD_SET.isdisjoint(tokens):
+        return ()
+    values = [value for token in tokens if token in _POI_KEYWORD_SET for value in _POI_AMENITY_KEYWORDS[token]]
+    # dict.fromkeys dedupes while keeping query-token order.
+    return tuple(dict.fromkeys(values))
 
 
+@lru_cache(maxsize=4096)
 def parse_coords(q: str) -> tuple[float, float] | None:
     if not q:
         return None
     candidate = unquote(q).strip()
     if not candidate:
         return None
-    for regex in (_GOOGLE_MAPS_AT_RE, _GOOGLE_MAPS_Q_RE, _COORD_PAIR_RE):
-        match = regex.search(candidate)
-        if not match:
-            continue
-        try:
-            lat = float(match.group(1))
-            lon = float(match.group(2))
-        except ValueError:
-            continue
-        if -90 <= lat <= 90 and -180 <= lon <= 180:
-            return lat, lon
+    # Precedence is "@" URL form, then query-param form, then the first bare pair;
+    # only the first match of each kind is considered.
+    first_at = first_param = first_any = None
+    for match in _COORDS_RE.finditer(candidate):
+        if first_any is None:
+            first_any = match
+        if match["at"] and first_at is None:
+            first_at = match
+            if _coords_in_range(match):
+                break
+        elif match["param"] and first_param is None:
+            first_param = match
+    for match in (first_at, first_param, first_any):
+        if match is not None and _coords_in_range(match):
+            return float(match["lat"]), float(match["lon"])
     return None
 
 
+def _coords_in_range(match: re.Match[str]) -> bool:
+    return -90 <= float(match["lat"]) <= 90 and -180 <= float(match["lon"]) <= 180
+
+
+# \w is str.isalnum() plus "_", so this accepts exactly what the old per-character check did.
+_SAFE_IDENTIFIER_RE = re.compile(r"[\w.]+")
+
+
 def _safe_identifier(value: str | None, fallback: str) -> str:
     candidate = (value or "").strip()
     if not candidate:
         return fallback
-    if all(ch.isalnum() or ch in {"_", "."} for ch in candidate):
+    if _SAFE_IDENTIFIER_RE.fullmatch(candidate):
         return candidate
     return fallback
 
 
+# Both helpers only ever see the import-time table constants, so memoize them.
+@lru_cache(maxsize=None)
 def _canonical_parcel_table(value: str | None) -> str:
     schema_name, table_name = _split_table_name(value or "")
     return _safe_identifier(f"{schema_name}.{table_name}", SUHAIL_PARCEL_TABLE)
 
 
-def _allowed_parcel_tables() -> set[str]:
-    return {
-        _canonical_parcel_table(SUHAIL_PARCEL_TABLE),
-        _canonical_parcel_table(PARCEL_TILE_TABLE),
-    }
+@lru_cache(maxsize=None)
+def _allowed_parcel_tables() -> frozenset[str]:
+    return frozenset(
+        {
+            _canonical_parcel_table(SUHAIL_PARCEL_TABLE),
+            _canonical_parcel_table(PARCEL_TILE_TABLE),
+        }
+    )
+
+
+def _keyword_number_patterns(keywords: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    return tuple(
+        re.compile(rf"{re.escape(keyword)}\s*[:#\-]*\s*(\d+)", flags=re.IGNORECASE) for keyword in keywords
+    )
+
 
+# Compiled once at import; parse_parcel_tokens() runs on every search request.
+_PLAN_NUMBER_RES = _keyword_number_patterns(("plan", "scheme", "مخطط"))
+_BLOCK_NUMBER_RES = _keyword_number_patterns(("block", "blk", "بلوك"))
+_PARCEL_NUMBER_RES = _keyword_number_patterns(("parcel", "plot", "قطعه", "قطعة"))
 
-def _extract_keyword_number(query: str, keywords: list[str]) -> str | None:
-    for keyword in keywords:
-        match = re.search(rf"{re.escape(keyword)}\s*[:#\-]*\s*(\d+)", query, flags=re.IGNORECASE)
+
+def _extract_keyword_number(query: str, patterns: tuple[re.Pattern[str], ...]) -> str | None:
+    for pattern in patterns:
+        match = pattern.search(query)
         if match:
             return match.group(1)
     return None
@@ -354,7 +588,8 @@ def _bbox_params(viewport_bbox: tuple[float, float, float, float] | None) -> dic
 
 
 # --- Dynamic OSM road SQL (supports ref + alt labels if present) ---
-_ROAD_SQL_CACHE: dict[tuple[str, ...], TextClause] = {}
+# Keyed by the column set, so entries never go stale; only the size is bounded.
+_ROAD_SQL_CACHE = TTLCache(maxsize=64)
 
 
 def _build_road_sql(db: Session) -> TextClause:
@@ -363,7 +598,8 @@ def _build_road_sql(db: Session) -> TextClause:
     without breaking environments where those columns don't exist.
     """
     cols = _table_columns(db, "public.planet_osm_line")
-    cache_key = tuple(sorted(cols))
+    # Column sets are frozensets (hash computed once), so they key the cache directly.
+    cache_key = cols
     cached = _ROAD_SQL_CACHE.get(cache_key)
     if cached is not None:
         return cached
@@ -408,7 +644,7 @@ def _build_road_sql(db: Session) -> TextClause:
         label_expr += ", tags->'name:ar', tags->'name:en', tags->'alt_name'"
     label_expr += ", '')"
 
-    sql = text(
+    sql = _search_text(
         f"""
         WITH candidates AS (
             SELECT
@@ -417,7 +653,11 @@ def _build_road_sql(db: Session) -> TextClause:
                 {expr_or_null("ref", "text")},
                 {expr_or_null("highway", "text")},
                 {label_expr} AS label,
-                ST_Transform(way, 4326) AS geom
+                way,
+                GREATEST(
+                    similarity(lower({label_expr}), :q_raw_lower),
+                    word_similarity(lower({label_expr}), :q_raw_lower)
+                ) AS score
             FROM planet_osm_line
             WHERE highway IS NOT NULL
               AND ({where_sql})
@@ -425,10 +665,7 @@ def _build_road_sql(db: Session) -> TextClause:
                 ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326),
                 3857
               )
-            ORDER BY GREATEST(
-                similarity(lower({label_expr}), :q_raw_lower),
-                word_similarity(lower({label_expr}), :q_raw_lower)
-            ) DESC
+            ORDER BY score DESC
             LIMIT :limit
         )
         SELECT
@@ -436,40 +673,48 @@ def _build_road_sql(db: Session) -> TextClause:
             'osm_line:' || osm_id AS id,
             label AS label,
             COALESCE(highway, 'road') AS subtitle,
-            ST_X(ST_PointOnSurface(geom)) AS lng,
-            ST_Y(ST_PointOnSurface(geom)) AS lat,
-            ST_XMin(geom) AS min_lng,
-            ST_YMin(geom) AS min_lat,
-            ST_XMax(geom) AS max_lng,
-            ST_YMax(geom) AS max_lat,
-            GREATEST(
-                similarity(lower(label), :q_raw_lower),
-                word_similarity(lower(label), :q_raw_lower)
-            ) AS score
+            ST_X(g.pt) AS lng,
+            ST_Y(g.pt) AS lat,
+            ST_XMin(g.box) AS min_lng,
+            ST_YMin(g.box) AS min_lat,
+            ST_XMax(g.box) AS max_lng,
+            ST_YMax(g.box) AS max_lat,
+            score
         FROM candidates
+        -- Surface point and bbox computed once per row instead of per output column.
+        -- Only the point and the envelope are reprojected, never the full geometry;
+        -- Web Mercator maps axis-aligned boxes onto axis-aligned boxes, so the bbox is exact.
+        CROSS JOIN LATERAL (
+            SELECT
+                ST_Transform(ST_PointOnSurface(way), 4326) AS pt,
+                Box2D(ST_Transform(ST_Envelope(way), 4326)) AS box
+        ) g
         """
     )
     _ROAD_SQL_CACHE[cache_key] = sql
     return sql
 
 
+@lru_cache(maxsize=4096)
 def parse_parcel_tokens(query: str) -> tuple[str | None, str | None, str | None]:
     normalized = normalize_search_text(query, replace_ta_marbuta=True).lower()
-    if not normalized:
+    # Every extraction below needs a digit; most name queries have none.
+    if not _DIGIT_RUN_RE.search(normalized):
         return None, None, None
-    plan = _extract_keyword_number(normalized, ["plan", "scheme", "مخطط"])
-    block = _extract_keyword_number(normalized, ["block", "blk", "بلوك"])
-    parcel = _extract_keyword_number(normalized, ["parcel", "plot", "قطعه", "قطعة"])
+    plan = _extract_keyword_number(normalized, _PLAN_NUMBER_RES)
+    block = _extract_keyword_number(normalized, _BLOCK_NUMBER_RES)
+    parcel = _extract_keyword_number(normalized, _PARCEL_NUMBER_RES)
 
     digit_query = query.translate(_ARABIC_DIGIT_MAP)
-    pattern_match = re.search(r"(\d+)\s*[-/]\s*(\d+)\s*[-/]\s*(\d+)", digit_query)
+    pattern_match = _PARCEL_TRIPLE_RE.search(digit_query)
     if pattern_match:
         plan = plan or pattern_match.group(1)
         block = block or pattern_match.group(2)
         parcel = parcel or pattern_match.group(3)
 
-    digits = re.findall(r"\d+", normalized)
-    if len(digits) >= 3:
+    # Only the first three digit runs matter; stop scanning once they are found.
+    digits = [match.group() for match in islice(_DIGIT_RUN_RE.finditer(normalized), 3)]
+    if len(digits) == 3:
         plan = plan or digits[0]
         block = block or digits[1]
         parcel = parcel or digits[2]
@@ -498,30 +743,29 @@ def _parse_viewport_bbox(raw: str | None) -> tuple[float, float, float, float] |
     return (min_lon, min_lat, max_lon, max_lat)
 
 
-def _bbox_from_row(row: dict[str, Any]) -> list[float] | None:
-    keys = ("min_lng", "min_lat", "max_lng", "max_lat")
-    if any(row.get(key) is None for key in keys):
-        return None
-    return [float(row[key]) for key in keys]
-
-
-def _center_from_row(row: dict[str, Any]) -> list[float] | None:
-    if row.get("lng") is None or row.get("lat") is None:
-        return None
-    return [float(row["lng"]), float(row["lat"])]
-
-
 def _row_to_item(row: dict[str, Any]) -> SearchItem | None:
-    center = _center_from_row(row)
-    if not center:
+    # Single pass over the row: each key is read once and the bbox is only
+    # materialised when all four corners are present.
+    get = row.get
+    lng = get("lng")
+    lat = get("lat")
+    if lng is None or lat is None:
         return None
-    bbox = _bbox_from_row(row)
-    return SearchItem(
-        type=str(row.get("type") or ""),
-        id=str(row.get("id") or ""),
-        label=str(row.get("label") or ""),
-        subtitle=row.get("subtitle"),
-        center=center,
+    min_lng = get("min_lng")
+    min_lat = get("min_lat")
+    max_lng = get("max_lng")
+    max_lat = get("max_lat")
+    bbox = None
+    if min_lng is not None and min_lat is not None and max_lng is not None and max_lat is not None:
+        bbox = [float(min_lng), float(min_lat), float(max_lng), float(max_lat)]
+    # Every field is already coerced to its declared type above (rows come from our own
+    # SQL), so skip per-field validation; FastAPI validates the response model once.
+    return SearchItem.model_construct(
+        type=str(get("type") or ""),
+        id=str(get("id") or ""),
+        label=str(get("label") or ""),
+        subtitle=get("subtitle"),
+        center=[float(lng), float(lat)],
         bbox=bbox,
     )
 
@@ -556,6 +800,56 @@ def _distance_boost_m(distance_m: float, *, max_boost: float = 0.25, fade_out_m:
     return max_boost * (1.0 - (distance_m / fade_out_m))
 
 
+# Below this many rows the NumPy setup costs more than the scalar loop saves.
+_VECTOR_SCORE_MIN_ROWS = 8
+
+
+def _spatial_boosts(
+    rows: list[dict[str, Any]],
+    viewport_bbox: tuple[float, float, float, float],
+) -> tuple[list[bool], list[float]]:
+    """
+    Per-row (inside-viewport flag, distance-to-center boost) for a batch of rows.
+    Rows without coordinates get (False, 0.0). Matches _haversine_m/_distance_boost_m.
+    """
+    min_lon, min_lat, max_lon, max_lat = viewport_bbox
+    center_lon = (min_lon + max_lon) / 2.0
+    center_lat = (min_lat + max_lat) / 2.0
+
+    if len(rows) < _VECTOR_SCORE_MIN_ROWS:
+        inside: list[bool] = []
+        distance: list[float] = []
+        for row in rows:
+            lng, lat = row.get("lng"), row.get("lat")
+            if lng is None or lat is None:
+                inside.append(False)
+                distance.append(0.0)
+                continue
+            lng, lat = float(lng), float(lat)
+            inside.append(min_lon <= lng <= max_lon and min_lat <= lat <= max_lat)
+            d_m = _haversine_m(center_lat, center_lon, lat, lng)
+            distance.append(_distance_boost_m(d_m, max_boost=0.25, fade_out_m=5000.0))
+        return inside, distance
+
+    count = len(rows)
+    lng = np.fromiter(
+        (np.nan if row.get("lng") is None else float(row["lng"]) for row in rows), dtype=np.float64, count=count
+    )
+    lat = np.fromiter(
+        (np.nan if row.get("lat") is None else float(row["lat"]) for row in rows), dtype=np.float64, count=count
+    )
+    has_coords = ~(np.isnan(lng) | np.isnan(lat))
+    inside_mask = has_coords & (lng >= min_lon) & (lng <= max_lon) & (lat >= min_lat) & (lat <= max_lat)
+
+    phi1 = math.radians(center_lat)
+    dphi = np.radians(lat - center_lat)
+    dlambda = np.radians(lng - center_lon)
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(np.radians(lat)) * np.sin(dlambda / 2) ** 2
+    d_m = 2 * 6371000.0 * np.arcsin(np.sqrt(a))
+    distance_boost = np.where(has_coords, 0.25 * (1.0 - np.clip(d_m, 0.0, 5000.0) / 5000.0), 0.0)
+    return inside_mask.tolist(), distance_boost.tolist()
+
+
 def _parcel_source_metadata(table_name: str) -> tuple[str, str]:
     lowered = table_name.lower()
     if "suhail" in lowered:
@@ -569,7 +863,7 @@ def _parcel_source_metadata(table_name: str) -> tuple[str, str]:
     return "parcel", "Parcel layer"
 
 
-def _parcel_extra_search_clauses(columns: set[str], *, table_alias: str = "p") -> list[tuple[str, str]]:
+def _parcel_extra_search_clauses(columns: frozenset[str], *, table_alias: str = "p") -> list[tuple[str, str]]:
     """
     Return extra (column, SQL condition) pairs for parcel search when columns exist.
     """
@@ -587,12 +881,41 @@ def _parcel_extra_search_clauses(columns: set[str], *, table_alias: str = "p") -
     return extra
 
 
+# --- Parcel search SQL (cached per table/column set, like _ROAD_SQL_CACHE) ---
+_PARCEL_SQL_CACHE = TTLCache(maxsize=64)
+
+
 def _parcel_search_sql(
     table_name: str,
-    columns: set[str],
+    columns: frozenset[str],
     id_prefix: str,
     include_source_label: bool,
+    exact_match: bool = False,
 ) -> TextClause | None:
+    cache_key = (table_name, columns, id_prefix, include_source_label, exact_match)
+    # A single get(): a separate membership check could race expiry/eviction.
+    # None is a valid cached result (no searchable columns), hence the sentinel.
+    cached = _PARCEL_SQL_CACHE.get(cache_key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+    sql = _build_parcel_search_sql(table_name, columns, id_prefix, include_source_label, exact_match)
+    _PARCEL_SQL_CACHE[cache_key] = sql
+    return sql
+
+
+def _build_parcel_search_sql(
+    table_name: str,
+    columns: frozenset[str],
+    id_prefix: str,
+    include_source_label: bool,
+    exact_match: bool = False,
+) -> TextClause | None:
+    """
+    Fuzzy parcel search over names/numbers, or with ``exact_match`` only the
+    plan/block/parcel equality lookup. The exact variant is a plain AND of equalities so
+    it can seek the (plan_number, block_number, parcel_number) btree; it is None when
+    the table lacks any of the three columns.
+    """
     has_street = "street_name" in columns
     has_municipality = "municipality_name" in columns
     has_neighborhood = "neighborhood_name" in columns
@@ -601,34 +924,35 @@ def _parcel_search_sql(
     has_parcel = "parcel_number" in columns
 
     search_clauses = []
-    if has_street:
-        search_clauses.append("(street_name IS NOT NULL AND lower(street_name) LIKE :q_like_lower)")
-    if has_municipality:
-        search_clauses.append("(municipality_name IS NOT NULL AND lower(municipality_name) LIKE :q_like_lower)")
-    if has_neighborhood:
-        search_clauses.append("(neighborhood_name IS NOT NULL AND lower(neighborhood_name) LIKE :q_like_lower)")
-    if has_plan:
-        search_clauses.append("(plan_number IS NOT NULL AND lower(plan_number::text) LIKE :q_like_lower)")
-    if has_block:
-        search_clauses.append("(block_number IS NOT NULL AND lower(block_number::text) LIKE :q_like_lower)")
-    if has_parcel:
-        search_clauses.append("(parcel_number IS NOT NULL AND lower(parcel_number::text) LIKE :q_like_lower)")
-    if has_plan and has_block and has_parcel:
+    if exact_match:
+        if not (has_plan and has_block and has_parcel):
+            return None
         search_clauses.append(
-            """
-            (
-                :plan IS NOT NULL
-                AND :block IS NOT NULL
-                AND :parcel IS NOT NULL
-                AND plan_number::text = :plan
-                AND block_number::text = :block
-                AND parcel_number::text = :parcel
-            )
-            """
+            "plan_number::text = :plan AND block_number::text = :block AND parcel_number::text = :parcel"
         )
+    else:
+        # Arabic name columns are folded to match the normalized query (see _ar_fold_sql).
+        if has_street:
+            search_clauses.append(f"(street_name IS NOT NULL AND {_ar_fold_sql('street_name')} LIKE :q_like_lower)")
+        if has_municipality:
+            search_clauses.append(
+                f"(municipality_name IS NOT NULL AND {_ar_fold_sql('municipality_name')} LIKE :q_like_lower)"
+            )
+        if has_neighborhood:
+            search_clauses.append(
+                f"(neighborhood_name IS NOT NULL AND {_ar_fold_sql('neighborhood_name')} LIKE :q_like_lower)"
+            )
+        if has_plan:
+            search_clauses.append("(plan_number IS NOT NULL AND lower(plan_number::text) LIKE :q_like_lower)")
+        if has_block:
+            search_clauses.append("(block_number IS NOT NULL AND lower(block_number::text) LIKE :q_like_lower)")
+        if has_parcel:
+            search_clauses.append("(parcel_number IS NOT NULL AND lower(parcel_number::text) LIKE :q_like_lower)")
+        # The plan/block/parcel triple is searched by the exact_match variant.
 
     extra_clauses = _parcel_extra_search_clauses(columns, table_alias="p")
-    search_clauses.extend([clause for _, clause in extra_clauses])
+    if not exact_match:
+        search_clauses.extend([clause for _, clause in extra_clauses])
 
     if not search_clauses:
         return None
@@ -673,7 +997,7 @@ def _parcel_search_sql(
     else:
         subtitle_expr = "NULL::text"
 
-    return text(
+    return _search_text(
         f"""
         WITH candidates AS (
             SELECT
@@ -684,13 +1008,15 @@ def _parcel_search_sql(
                 {expr_or_null("plan_number", "text")},
                 {expr_or_null("block_number", "text")},
                 {expr_or_null("parcel_number", "text")},
-                p.geom
+                p.geom,
+                -- Scored once here: the outer SELECT reads FROM candidates and has no p.* columns.
+                similarity({_ar_fold_sql(similarity_expr)}, :q_raw_lower) AS score
             FROM {table_name} p
             WHERE (
                 {' OR '.join(search_clauses)}
             )
               AND p.geom && ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326)
-            ORDER BY similarity(lower({similarity_expr}), lower(:q_raw)) DESC
+            ORDER BY score DESC
             LIMIT :limit
         )
         SELECT
@@ -698,38 +1024,91 @@ def _parcel_search_sql(
             '{id_prefix}:' || id AS id,
             {label_expr} AS label,
             {subtitle_expr} AS subtitle,
-            ST_X(ST_PointOnSurface(geom)) AS lng,
-            ST_Y(ST_PointOnSurface(geom)) AS lat,
-            ST_XMin(geom) AS min_lng,
-            ST_YMin(geom) AS min_lat,
-            ST_XMax(geom) AS max_lng,
-            ST_YMax(geom) AS max_lat,
-            similarity(lower({similarity_expr}), lower(:q_raw)) AS score,
+            ST_X(g.pt) AS lng,
+            ST_Y(g.pt) AS lat,
+            ST_XMin(g.box) AS min_lng,
+            ST_YMin(g.box) AS min_lat,
+            ST_XMax(g.box) AS max_lng,
+            ST_YMax(g.box) AS max_lat,
+            score,
             plan_number,
             block_number,
             parcel_number
         FROM candidates
+        CROSS JOIN LATERAL (SELECT ST_PointOnSurface(geom) AS pt, Box2D(geom) AS box) g
         """
     )
 
 
+@lru_cache(maxsize=None)
+def _parcel_search_candidates() -> tuple[tuple[str, str, str], ...]:
+    # Depends only on the import-time table constants, so resolve it once.
+    safe_active = _canonical_parcel_table(PARCEL_TILE_TABLE)
+    suhail_table = _canonical_parcel_table(SUHAIL_PARCEL_TABLE)
+    table_names = [safe_active] if safe_active == suhail_table else [safe_active, suhail_table]
+    allowed_tables = _allowed_parcel_tables()
+    return tuple(
+        (table_name, *_parcel_source_metadata(table_name))
+        for table_name in table_names
+        if table_name in allowed_tables
+    )
+
+
+def _parcel_search_tables(
+    db: Session, tables_present: dict[str, bool] | None = None
+) -> list[tuple[str, str, str]]:
+    """
+    Parcel tables to search as (table_name, id_prefix, source_label): the active tile
+    table first, then Suhail when it is a different table. Missing tables are skipped.
+    tables_present is an optional _prewarm_tables() result consulted before the DB.
+    """
+    return [
+        candidate
+        for candidate in _parcel_search_candidates()
+        if _table_known(db, candidate[0], tables_present)
+    ]
+
+
+def _parcel_search_sql_for_table(
+    db: Session,
+    table_name: str,
+    id_prefix: str,
+    include_source_label: bool,
+    exact_match: bool = False,
+) -> TextClause | None:
+    return _parcel_search_sql(
+        table_name=_safe_identifier(table_name, SUHAIL_PARCEL_TABLE),
+        columns=_table_columns(db, table_name),
+        id_prefix=id_prefix,
+        include_source_label=include_source_label,
+        exact_match=exact_match,
+    )
+
+
+# One alternation per intent; .search() is the same substring test as the old
+# any(token in query ...) loops, but in a single pass over the query.
+_PARCEL_INTENT_RE = re.compile("|".join(map(re.escape, ["parcel", "plot", "قطعه", "قطعة"])))
+_ROAD_INTENT_RE = re.compile(
+    "|".join(map(re.escape, ["road", "street", "st", "rd", "avenue", "ave", "شارع", "طريق"]))
+)
+_DISTRICT_INTENT_RE = re.compile(
+    "|".join(map(re.escape, ["district", "neighborhood", "neighbourhood", "حي", "حى"]))
+)
+
+
 def _intent_flags(normalized_query: str, plan: str | None, block: str | None, parcel: str | None) -> dict[str, bool]:
     has_parcel_tokens = any([plan, block, parcel])
     intent = {
-        "parcel": has_parcel_tokens or any(
-            token in normalized_query for token in ["parcel", "plot", "قطعه", "قطعة"]
-        ),
-        "road": any(token in normalized_query for token in ["road", "street", "st", "rd", "avenue", "ave", "شارع", "طريق"]),
-        "district": any(
-            token in normalized_query for token in ["district", "neighborhood", "neighbourhood", "حي", "حى"]
-        ),
+        "parcel": has_parcel_tokens or _PARCEL_INTENT_RE.search(normalized_query) is not None,
+        "road": _ROAD_INTENT_RE.search(normalized_query) is not None,
+        "district": _DISTRICT_INTENT_RE.search(normalized_query) is not None,
     }
     intent["poi"] = not any(intent.values())
     return intent
 
 
-def _score_row(
-    row: dict[str, Any],
+def _score_rows(
+    rows: list[dict[str, Any]],
     intent: dict[str, bool],
     viewport_bbox: tuple[float, float, float, float] | None,
     plan: str | None,
@@ -737,67 +1116,72 @@ def _score_row(
     parcel: str | None,
     query_norm_lower: str,
     query_tokens: list[str],
-) -> float:
-    base_score = float(row.get("score") or 0.0)
-    row_type = str(row.get("type") or "")
-    boost = 0.0
-
-    # --- 5.1 Prefix/exact/token coverage boosts ---
-    label_raw = str(row.get("label") or "")
-    label_norm_lower = normalize_search_text(label_raw, replace_ta_marbuta=True).lower()
-
-    if query_norm_lower and label_norm_lower:
-        if label_norm_lower == query_norm_lower:
-            boost += 0.35  # exact label match (very strong signal)
-        elif label_norm_lower.startswith(query_norm_lower) and len(query_norm_lower) >= 2:
-            boost += 0.22  # prefix match (very common user intent)
-        if query_tokens:
-            # token coverage: all query tokens present in label
-            if all(tok in label_norm_lower for tok in query_tokens):
-                boost += 0.18
-
-    # --- existing intent boosts ---
-    if row_type == "parcel":
-        if intent.get("parcel"):
-            boost += 0.6
-        if plan and block and parcel:
+) -> list[tuple[float, dict[str, Any]]]:
+    """
+    Score a batch of rows for one query as (score, row) pairs. Everything that depends
+    only on the request (intent boosts, viewport center, query checks) is computed once
+    per batch instead of once per row.
+    """
+    intent_boosts = {
+        "parcel": 0.6 if intent.get("parcel") else 0.0,
+        "road": 0.3 if intent.get("road") else 0.0,
+        "district": 0.3 if intent.get("district") else 0.0,
+        "poi": 0.15 if intent.get("poi") else 0.0,
+    }
+    match_parcel_tokens = bool(plan and block and parcel)
+    prefix_query = len(query_norm_lower) >= 2
+    # The spatial terms are plain arithmetic, so they are computed for the whole batch at once.
+    if viewport_bbox:
+        inside_viewport, distance_boosts = _spatial_boosts(rows, viewport_bbox)
+
+    scored: list[tuple[float, dict[str, Any]]] = []
+    for index, row in enumerate(rows):
+        get = row.get
+        base_score = float(get("score") or 0.0)
+        row_type = str(get("type") or "")
+        boost = 0.0
+
+        # --- 5.1 Prefix/exact/token coverage boosts ---
+        label_raw = str(get("label") or "")
+        label_norm_lower = normalize_search_text(label_raw, replace_ta_marbuta=True).lower()
+
+        if query_norm_lower and label_norm_lower:
+            if label_norm_lower == query_norm_lower:
+                boost += 0.35  # exact label match (very strong signal)
+            elif prefix_query and label_norm_lower.startswith(query_norm_lower):
+                boost += 0.22  # prefix match (very common user intent)
+            if query_tokens:
+                # token coverage: all query tokens present in label
+                if all(tok in label_norm_lower for tok in query_tokens):
+                    boost += 0.18
+
+        # --- existing intent boosts ---
+        intent_boost = intent_boosts.get(row_type, 0.0)
+        if intent_boost:
+            boost += intent_boost
+        if row_type == "parcel" and match_parcel_tokens:
             if (
-                str(row.get("plan_number")) == plan
-                and str(row.get("block_number")) == block
-                and str(row.get("parcel_number")) == parcel
+                str(get("plan_number")) == plan
+                and str(get("block_number")) == block
+                and str(get("parcel_number")) == parcel
             ):
                 boost += 1.0
-    elif row_type == "road" and intent.get("road"):
-        boost += 0.3
-    elif row_type == "district" and intent.get("district"):
-        boost += 0.3
-    elif row_type == "poi" and intent.get("poi"):
-        boost += 0.15
-
-    # --- 5.2 Distance-to-viewport-center (soft spatial preference) ---
-    if viewport_bbox and row.get("lng") is not None and row.get("lat") is not None:
-        min_lon, min_lat, max_lon, max_lat = viewport_bbox
-        lng = float(row["lng"])
-        lat = float(row["lat"])
-
-        # Keep existing binary inside-bbox boost
-        if min_lon <= lng <= max_lon and min_lat <= lat <= max_lat:
-            boost += 0.2
-
-        # Add smooth distance-to-center boost
-        center_lon = (min_lon + max_lon) / 2.0
-        center_lat = (min_lat + max_lat) / 2.0
-        d_m = _haversine_m(center_lat, center_lon, lat, lng)
-        boost += _distance_boost_m(d_m, max_boost=0.25, fade_out_m=5000.0)
-
-    # --- 5.3 Source confidence boosts (Aqar district hulls) ---
-    # If external_feature hulls store a point count or similar metadata, use it.
-    if row_type == "district":
+
+        # --- 5.2 Distance-to-viewport-center (soft spatial preference) ---
+        if viewport_bbox and get("lng") is not None and get("lat") is not None:
+            # Keep existing binary inside-bbox boost
+            if inside_viewport[index]:
+                boost += 0.2
+
+            # Add smooth distance-to-center boost
+            boost += distance_boosts[index]
+
+        # --- 5.3 Source confidence boosts (Aqar district hulls) ---
+        # If external_feature hulls store a point count or similar metadata, use it.
         # We encode layer_name in id: "district:<layer_name>:<id>"
-        row_id = str(row.get("id") or "")
-        if ":aqar_district_hulls:" in row_id:
+        if row_type == "district" and ":aqar_district_hulls:" in str(get("id") or ""):
             # Try a few possible property-derived columns included by SQL
-            raw_cnt = row.get("point_count") or row.get("points_count") or row.get("n_points")
+            raw_cnt = get("point_count") or get("points_count") or get("n_points")
             try:
                 cnt = int(raw_cnt) if raw_cnt is not None else 0
             except (TypeError, ValueError):
@@ -805,7 +1189,8 @@ def _score_row(
             if cnt > 0:
                 # Log-scaled confidence up to +0.15
                 boost += min(0.15, 0.02 * math.log1p(cnt) * 3.0)
-    return base_score + boost
+        scored.append((base_score + boost, row))
+    return scored
 
 
 def _merge_global_ranked(
@@ -819,36 +1204,33 @@ def _merge_global_ranked(
     If per_type_cap is set, we limit the number of returned items per type to encourage diversity,
     but still preserve global relevance ordering among eligible candidates.
     """
-    candidates: list[tuple[float, dict[str, Any]]] = []
-    for rows in scored_rows.values():
-        if not rows:
-            continue
-        candidates.extend(rows)
-
-    # Highest score first
-    candidates.sort(key=lambda entry: entry[0], reverse=True)
+    # Highest score first. Only the first few candidates are usually consumed, so
+    # heapify (O(n)) and pop lazily instead of sorting everything; the index keeps
+    # ties in input order, exactly like the stable sort did.
+    candidates = [
+        (-score, index, row)
+        for index, (score, row) in enumerate(chain.from_iterable(scored_rows.values()))
+    ]
+    heapq.heapify(candidates)
 
     items: list[SearchItem] = []
-    seen: set[tuple[str, str]] = set()
-    per_type_counts: dict[str, int] = {}
+    seen: set[str] = set()
+    per_type_counts: Counter[str] = Counter()
 
-    for _score, row in candidates:
-        if len(items) >= limit:
-            break
+    while candidates and len(items) < limit:
+        _neg_score, _index, row = heapq.heappop(candidates)
         item = _row_to_item(row)
         if not item:
             continue
-        key = (item.type, item.id)
+        # Types never contain ":", so this key is as unambiguous as the (type, id) tuple.
+        key = f"{item.type}:{item.id}"
         if key in seen:
             continue
-
-        if per_type_cap is not None:
-            current = per_type_counts.get(item.type, 0)
-            if current >= per_type_cap:
-                continue
+        if per_type_cap is not None and per_type_counts[item.type] >= per_type_cap:
+            continue
 
         seen.add(key)
-        per_type_counts[item.type] = per_type_counts.get(item.type, 0) + 1
+        per_type_counts[item.type] += 1
         items.append(item)
     return items
 
@@ -867,8 +1249,9 @@ def _merge_round_robin(
         remaining = [key for key in scored_rows.keys() if key not in type_order]
         type_order = type_order + remaining
 
-    per_type_rows: dict[str, list[tuple[float, dict[str, Any]]]] = {
-        key: sorted(rows, key=lambda entry: entry[0], reverse=True) for key, rows in scored_rows.items()
+    # deques so taking each type's next-best row is O(1) (list.pop(0) shifts the rest).
+    per_type_rows: dict[str, deque[tuple[float, dict[str, Any]]]] = {
+        key: deque(sorted(rows, key=itemgetter(0), reverse=True)) for key, rows in scored_rows.items()
     }
     items: list[SearchItem] = []
     seen: set[tuple[str, str]] = set()
@@ -880,7 +1263,7 @@ def _merge_round_robin(
             rows = per_type_rows.get(key)
             if not rows:
                 continue
-            _score, row = rows.pop(0)
+            _score, row = rows.popleft()
             item = _row_to_item(row)
             if not item:
                 continue
@@ -892,8 +1275,9 @@ def _merge_round_robin(
     return items
 
 
+@lru_cache(maxsize=None)
 def _build_search_index_sql() -> TextClause:
-    return text(
+    return _search_text(
         f"""
         WITH candidates AS (
           SELECT
@@ -945,13 +1329,21 @@ def _build_search_index_sql() -> TextClause:
           )
           ORDER BY score DESC
           LIMIT :limit
+        ),
+        -- Collapse duplicate (type, id) rows (e.g. split OSM multipolygons) in the database,
+        -- keeping the best-scoring one, so they never reach Python-side merging.
+        deduped AS (
+          SELECT DISTINCT ON (type, id) *
+          FROM candidates
+          ORDER BY type, id, score DESC
         )
-        SELECT * FROM candidates
+        SELECT * FROM deduped
+        ORDER BY score DESC
         """
     )
 
 
-_POI_POINT_SQL = text(
+_POI_POINT_SQL = _search_text(
     """
     WITH candidates AS (
         SELECT
@@ -967,7 +1359,26 @@ _POI_POINT_SQL = text(
             man_made,
             sport,
             historic,
-            ST_Transform(way, 4326) AS geom
+            way,
+            -- Scored once here; ORDER BY and the outer SELECT reuse the column.
+            similarity(
+                lower(
+                    COALESCE(
+                        name,
+                        amenity,
+                        shop,
+                        tourism,
+                        leisure,
+                        office,
+                        building,
+                        landuse,
+                        man_made,
+                        sport,
+                        historic
+                    )
+                ),
+                :q_raw_lower
+            ) AS score
         FROM planet_osm_point
         WHERE (
             (
@@ -987,24 +1398,7 @@ _POI_POINT_SQL = text(
             ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326),
             3857
           )
-        ORDER BY similarity(
-            lower(
-                COALESCE(
-                    name,
-                    amenity,
-                    shop,
-                    tourism,
-                    leisure,
-                    office,
-                    building,
-                    landuse,
-                    man_made,
-                    sport,
-                    historic
-                )
-            ),
-            :q_raw_lower
-        ) DESC
+        ORDER BY score DESC
         LIMIT :limit
     )
     SELECT
@@ -1024,35 +1418,20 @@ _POI_POINT_SQL = text(
             historic
         ) AS label,
         COALESCE(amenity, shop, tourism, leisure, office, building, landuse, man_made, sport, historic) AS subtitle,
-        ST_X(geom) AS lng,
-        ST_Y(geom) AS lat,
-        ST_XMin(geom) AS min_lng,
-        ST_YMin(geom) AS min_lat,
-        ST_XMax(geom) AS max_lng,
-        ST_YMax(geom) AS max_lat,
-        similarity(
-            lower(
-                COALESCE(
-                    name,
-                    amenity,
-                    shop,
-                    tourism,
-                    leisure,
-                    office,
-                    building,
-                    landuse,
-                    man_made,
-                    sport,
-                    historic
-                )
-            ),
-            :q_raw_lower
-        ) AS score
+        ST_X(g.pt) AS lng,
+        ST_Y(g.pt) AS lat,
+        ST_XMin(g.pt) AS min_lng,
+        ST_YMin(g.pt) AS min_lat,
+        ST_XMax(g.pt) AS max_lng,
+        ST_YMax(g.pt) AS max_lat,
+        score
     FROM candidates
+    -- Points reprojected once per returned row, after the LIMIT.
+    CROSS JOIN LATERAL (SELECT ST_Transform(way, 4326) AS pt) g
     """
 )
 
-_POI_POLYGON_SQL = text(
+_POI_POLYGON_SQL = _search_text(
     """
     WITH candidates AS (
         SELECT
@@ -1068,7 +1447,26 @@ _POI_POLYGON_SQL = text(
             man_made,
             sport,
             historic,
-            ST_Transform(way, 4326) AS geom
+            way,
+            -- Scored once here; ORDER BY and the outer SELECT reuse the column.
+            similarity(
+                lower(
+                    COALESCE(
+                        name,
+                        amenity,
+                        shop,
+                        tourism,
+                        leisure,
+                        office,
+                        building,
+                        landuse,
+                        man_made,
+                        sport,
+                        historic
+                    )
+                ),
+                :q_raw_lower
+            ) AS score
         FROM planet_osm_polygon
         WHERE (
             (
@@ -1100,24 +1498,7 @@ _POI_POLYGON_SQL = text(
             ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326),
             3857
           )
-        ORDER BY similarity(
-            lower(
-                COALESCE(
-                    name,
-                    amenity,
-                    shop,
-                    tourism,
-                    leisure,
-                    office,
-                    building,
-                    landuse,
-                    man_made,
-                    sport,
-                    historic
-                )
-            ),
-            :q_raw_lower
-        ) DESC
+        ORDER BY score DESC
         LIMIT :limit
     )
     SELECT
@@ -1137,36 +1518,27 @@ _POI_POLYGON_SQL = text(
             historic
         ) AS label,
         COALESCE(amenity, shop, tourism, leisure, office, building, landuse, man_made, sport, historic) AS subtitle,
-        ST_X(ST_PointOnSurface(geom)) AS lng,
-        ST_Y(ST_PointOnSurface(geom)) AS lat,
-        ST_XMin(geom) AS min_lng,
-        ST_YMin(geom) AS min_lat,
-        ST_XMax(geom) AS max_lng,
-        ST_YMax(geom) AS max_lat,
-        similarity(
-            lower(
-                COALESCE(
-                    name,
-                    amenity,
-                    shop,
-                    tourism,
-                    leisure,
-                    office,
-                    building,
-                    landuse,
-                    man_made,
-                    sport,
-                    historic
-                )
-            ),
-            :q_raw_lower
-        ) AS score
+        ST_X(g.pt) AS lng,
+        ST_Y(g.pt) AS lat,
+        ST_XMin(g.box) AS min_lng,
+        ST_YMin(g.box) AS min_lat,
+        ST_XMax(g.box) AS max_lng,
+        ST_YMax(g.box) AS max_lat,
+        score
     FROM candidates
+    CROSS JOIN LATERAL (
+        SELECT
+            ST_Transform(ST_PointOnSurface(way), 4326) AS pt,
+            Box2D(ST_Transform(ST_Envelope(way), 4326)) AS box
+    ) g
     """
 )
 
-_DISTRICT_EXTERNAL_SQL = text(
-    """
+_DISTRICT_LABEL_EXPR = "COALESCE(properties->>'district_raw', properties->>'name', properties->>'district')"
+_DISTRICT_LABEL_FOLDED = _ar_fold_sql(_DISTRICT_LABEL_EXPR)
+
+_DISTRICT_EXTERNAL_SQL = _search_text(
+    f"""
     WITH candidates AS (
         SELECT
             id,
@@ -1180,51 +1552,52 @@ _DISTRICT_EXTERNAL_SQL = text(
               NULLIF(properties->>'count','')::int,
               0
             ) AS point_count,
-            ST_SetSRID(ST_GeomFromGeoJSON(geometry::text), 4326) AS geom
+            parsed.geom,
+            GREATEST(
+                similarity({_DISTRICT_LABEL_FOLDED}, :q_raw_lower),
+                word_similarity({_DISTRICT_LABEL_FOLDED}, :q_raw_lower)
+            ) AS score
         FROM external_feature
+        -- Parse the GeoJSON once per row; the bbox test and the output share it.
+        CROSS JOIN LATERAL (SELECT ST_SetSRID(ST_GeomFromGeoJSON(geometry::text), 4326) AS geom) parsed
         WHERE layer_name = 'aqar_district_hulls'
           AND (
             (
               -- Add trigram operator for typo tolerance with LIKE fallback for short queries.
-              (char_length(:q_raw_lower) >= 3 AND lower(COALESCE(properties->>'district_raw', properties->>'name', properties->>'district')) % :q_raw_lower)
-              OR lower(COALESCE(properties->>'district_raw', properties->>'name', properties->>'district')) LIKE :q_like_lower
+              (char_length(:q_raw_lower) >= 3 AND {_DISTRICT_LABEL_FOLDED} % :q_raw_lower)
+              OR {_DISTRICT_LABEL_FOLDED} LIKE :q_like_lower
             )
           )
-          AND ST_SetSRID(ST_GeomFromGeoJSON(geometry::text), 4326)
-              && ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326)
-        ORDER BY GREATEST(
-            similarity(lower(COALESCE(properties->>'district_raw', properties->>'name', properties->>'district')), :q_raw_lower),
-            word_similarity(lower(COALESCE(properties->>'district_raw', properties->>'name', properties->>'district')), :q_raw_lower)
-        ) DESC
+          AND parsed.geom && ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326)
+        ORDER BY score DESC
         LIMIT :limit
     )
     SELECT
         'district' AS type,
         'district:' || COALESCE(layer_name, 'external') || ':' || id AS id,
-        COALESCE(properties->>'district_raw', properties->>'name', properties->>'district') AS label,
+        {_DISTRICT_LABEL_EXPR} AS label,
         ('District • ' || COALESCE(layer_name, 'external')) AS subtitle,
         point_count,
-        ST_X(ST_PointOnSurface(geom)) AS lng,
-        ST_Y(ST_PointOnSurface(geom)) AS lat,
-        ST_XMin(geom) AS min_lng,
-        ST_YMin(geom) AS min_lat,
-        ST_XMax(geom) AS max_lng,
-        ST_YMax(geom) AS max_lat,
-        GREATEST(
-            similarity(lower(COALESCE(properties->>'district_raw', properties->>'name', properties->>'district')), :q_raw_lower),
-            word_similarity(lower(COALESCE(properties->>'district_raw', properties->>'name', properties->>'district')), :q_raw_lower)
-        ) AS score
+        ST_X(g.pt) AS lng,
+        ST_Y(g.pt) AS lat,
+        ST_XMin(g.box) AS min_lng,
+        ST_YMin(g.box) AS min_lat,
+        ST_XMax(g.box) AS max_lng,
+        ST_YMax(g.box) AS max_lat,
+        score
     FROM candidates
+    CROSS JOIN LATERAL (SELECT ST_PointOnSurface(geom) AS pt, Box2D(geom) AS box) g
     """
 )
 
-_DISTRICT_FALLBACK_SQL = text(
+_DISTRICT_FALLBACK_SQL = _search_text(
     """
     WITH candidates AS (
         SELECT
             osm_id,
             name,
-            ST_Transform(way, 4326) AS geom
+            way,
+            similarity(lower(name), :q_raw_lower) AS score
         FROM planet_osm_polygon
         WHERE name IS NOT NULL
           AND (
@@ -1239,7 +1612,7 @@ _DISTRICT_FALLBACK_SQL = text(
             ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326),
             3857
           )
-        ORDER BY similarity(lower(name), :q_raw_lower) DESC
+        ORDER BY score DESC
         LIMIT :limit
     )
     SELECT
@@ -1247,17 +1620,294 @@ _DISTRICT_FALLBACK_SQL = text(
         'osm_district:' || osm_id AS id,
         name AS label,
         'District' AS subtitle,
-        ST_X(ST_PointOnSurface(geom)) AS lng,
-        ST_Y(ST_PointOnSurface(geom)) AS lat,
-        ST_XMin(geom) AS min_lng,
-        ST_YMin(geom) AS min_lat,
-        ST_XMax(geom) AS max_lng,
-        ST_YMax(geom) AS max_lat,
-        similarity(lower(name), :q_raw_lower) AS score
+        NULL::int AS point_count,
+        ST_X(g.pt) AS lng,
+        ST_Y(g.pt) AS lat,
+        ST_XMin(g.box) AS min_lng,
+        ST_YMin(g.box) AS min_lat,
+        ST_XMax(g.box) AS max_lng,
+        ST_YMax(g.box) AS max_lat,
+        score
     FROM candidates
+    CROSS JOIN LATERAL (
+        SELECT
+            ST_Transform(ST_PointOnSurface(way), 4326) AS pt,
+            Box2D(ST_Transform(ST_Envelope(way), 4326)) AS box
+    ) g
     """
 )
 
+# Both district sources in one statement: each branch keeps its own index-backed
+# LIMIT, then the union is cut to the best :limit rows overall. Column lists match
+# (the OSM branch has a NULL point_count).
+_DISTRICT_SQL = _search_text(
+    f"""
+    SELECT *
+    FROM (
+        ({_DISTRICT_EXTERNAL_SQL.text})
+        UNION ALL
+        ({_DISTRICT_FALLBACK_SQL.text})
+    ) districts
+    ORDER BY score DESC
+    LIMIT :limit
+    """
+)
+
+
+def _district_search_sql(has_external: bool, has_osm_polygon: bool) -> TextClause | None:
+    if has_external and has_osm_polygon:
+        return _DISTRICT_SQL
+    if has_external:
+        return _DISTRICT_EXTERNAL_SQL
+    if has_osm_polygon:
+        return _DISTRICT_FALLBACK_SQL
+    return None
+
+
+def warm_search_statements(db: Session) -> int:
+    """
+    Run each search statement once with a throwaway query so the first real request on
+    a worker doesn't pay for cold trigram/GiST index pages and statement compilation.
+    Failures are logged and rolled back; returns the number of statements that ran.
+    """
+    params: dict[str, Any] = {
+        "q_raw_lower": "xxxxx",
+        "q_like_lower": "%xxxxx%",
+        "limit": 1,
+        "poi_amenities": [],
+        "plan": None,
+        "block": None,
+        "parcel": None,
+        "source_label": None,
+        "has_viewport": 0,
+        **_bbox_params(None),
+    }
+    # Same batched catalog lookups as the request path; this also leaves the table,
+    # column and per-table parcel SQL caches populated for the first request.
+    tables_present = _prewarm_tables(db, [*_SEARCH_TABLES, *sorted(_allowed_parcel_tables())])
+
+    def has_table(table_name: str) -> bool:
+        return _table_known(db, table_name, tables_present)
+
+    statements: list[Any] = []
+    if has_table("public.search_index_mat"):
+        statements.append(_build_search_index_sql())
+    else:
+        if has_table("public.planet_osm_point"):
+            statements.append(_POI_POINT_SQL)
+        if has_table("public.planet_osm_polygon"):
+            statements.append(_POI_POLYGON_SQL)
+        district_sql = _district_search_sql(
+            has_table("public.external_feature"), has_table("public.planet_osm_polygon")
+        )
+        if district_sql is not None:
+            statements.append(district_sql)
+        parcel_tables = _parcel_search_tables(db, tables_present)
+        has_line_table = has_table("public.planet_osm_line")
+        column_tables = [table_name for table_name, _, _ in parcel_tables]
+        if has_line_table:
+            column_tables.append("public.planet_osm_line")
+        _prewarm_columns(db, column_tables)
+        if has_line_table:
+            statements.append(_build_road_sql(db))
+        for table_name, prefix, _label in parcel_tables:
+            sql = _parcel_search_sql_for_table(db, table_name, prefix, len(parcel_tables) > 1)
+            if sql is not None:
+                statements.append(sql)
+
+    warmed = 0
+    for sql in statements:
+        try:
+            db.execute(sql, params).fetchall()
+            warmed += 1
+        except SQLAlchemyError as exc:
+            logger.warning("Search warm-up statement failed: %s", exc)
+            db.rollback()
+    return warmed
+
+
+# Whole /v1/search responses keyed by the normalized inputs. Entries are never
+# mutated after being stored, so hits return the same SearchResponse instance.
+_SEARCH_RESPONSE_TTL = 60  # seconds
+_SEARCH_RESPONSE_CACHE = TTLCache(maxsize=4096, ttl=_SEARCH_RESPONSE_TTL)
+
+_QUERY_EXECUTOR: ThreadPoolExecutor | None = None
+_QUERY_EXECUTOR_LOCK = threading.Lock()
+
+
+def _query_executor() -> ThreadPoolExecutor:
+    # One shared pool per process, so concurrent requests together never hold more
+    # than SEARCH_QUERY_CONCURRENCY extra pooled connections.
+    global _QUERY_EXECUTOR
+    with _QUERY_EXECUTOR_LOCK:
+        if _QUERY_EXECUTOR is None:
+            _QUERY_EXECUTOR = ThreadPoolExecutor(
+                max_workers=settings.SEARCH_QUERY_CONCURRENCY, thread_name_prefix="search-query"
+            )
+        return _QUERY_EXECUTOR
+
+
+class _SearchOutcome:
+    """
+    Per-request record of whether any search statement failed or timed out. Such a
+    response is missing rows, so it must not be stored in the response cache.
+    """
+
+    __slots__ = ("degraded",)
+
+    def __init__(self) -> None:
+        self.degraded = False
+
+
+def _run_search_statement(
+    db: Session,
+    sql: Any,
+    params: dict[str, Any],
+    outcome: _SearchOutcome | None = None,
+) -> list[dict[str, Any]]:
+    try:
+        # RowMapping views over the fetched Row tuples (no per-row dict copy); .all()
+        # fetches in one batch instead of iterating the result row by row.
+        return db.execute(sql, params).mappings().all()
+    except SQLAlchemyError as exc:
+        logger.warning("Search query failed: %s", exc)
+        if outcome is not None:
+            outcome.degraded = True
+        # A failed (or timed-out) statement aborts the transaction; reset it so the
+        # session stays usable for the remaining statements.
+        db.rollback()
+        return []
+
+
+# Bind name -> setting applied by _prepare_search_session.
+_SEARCH_SESSION_SETTINGS = {
+    "trgm_threshold": "pg_trgm.similarity_threshold",
+    "timeout": "statement_timeout",
+}
+
+
+@lru_cache(maxsize=4)
+def _search_session_sql(names: tuple[str, ...]) -> TextClause:
+    # Transaction-local (is_local=true) settings, so they end with the session's
+    # transaction and never leak into pooled connections.
+    calls = ", ".join(f"set_config('{_SEARCH_SESSION_SETTINGS[name]}', :{name}, true)" for name in names)
+    return text(f"SELECT {calls}")
+
+
+def _prepare_search_session(db: Session, *, limit_statement_time: bool = False) -> None:
+    """
+    Apply SEARCH_TRGM_THRESHOLD (and, for parallel statements, the statement timeout;
+    Postgres then cancels a slow backend itself) to the session's transaction.
+    Costs no round-trip when neither is configured.
+    """
+    params: dict[str, str] = {}
+    if settings.SEARCH_TRGM_THRESHOLD is not None:
+        params["trgm_threshold"] = str(settings.SEARCH_TRGM_THRESHOLD)
+    timeout_ms = settings.SEARCH_STATEMENT_TIMEOUT_MS if limit_statement_time else 0
+    if timeout_ms > 0:
+        params["timeout"] = f"{timeout_ms}ms"
+    if not params:
+        return
+    try:
+        db.execute(_search_session_sql(tuple(params)), params)
+    except SQLAlchemyError as exc:
+        logger.warning("Search session settings not applied: %s", exc)
+        db.rollback()
+
+
+def _run_search_statements_concurrently(
+    db: Session,
+    statements: list[tuple[Any, dict[str, Any]]],
+    outcome: _SearchOutcome | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Run independent search statements in parallel and return their rows in input order.
+    The first statement runs on the request session in the calling thread (which would
+    otherwise just wait); the rest go to the shared pool, where each worker opens its
+    own DB session — SQLAlchemy sessions are not thread-safe. Every statement runs under
+    SEARCH_STATEMENT_TIMEOUT_MS, so the slowest table bounds latency only up to that.
+    """
+
+    def run_on_worker_session(statement: tuple[Any, dict[str, Any]]) -> list[dict[str, Any]]:
+        worker_db: Session = db_session.SessionLocal()
+        try:
+            _prepare_search_session(worker_db, limit_statement_time=True)
+            return _run_search_statement(worker_db, *statement, outcome)
+        except SQLAlchemyError as exc:
+            logger.warning("Search worker session failed: %s", exc)
+            if outcome is not None:
+                outcome.degraded = True
+            return []
+        finally:
+            worker_db.close()
+
+    futures = [_query_executor().submit(run_on_worker_session, statement) for statement in statements[1:]]
+    _prepare_search_session(db, limit_statement_time=True)
+    first_rows = _run_search_statement(db, *statements[0], outcome)
+    return [first_rows, *(future.result() for future in futures)]
+
+
+# Same bind-parameter rule text() uses: ":name", but not "::cast" or "\\:".
+_BIND_PARAM_RE = re.compile(r"(?<![:\w\\]):(\w+)(?!:)")
+_FUSED_SQL_CACHE = TTLCache(maxsize=64)
+
+
+def _fused_search_sql(statements: list[tuple[Any, dict[str, Any]]]) -> TextClause:
+    """
+    UNION ALL of several search statements, each wrapped as a subquery whose rows are
+    returned as jsonb (so differing column sets line up) and tagged with the statement
+    index. Bind names get an "s<index>_" prefix so per-statement values don't collide.
+    """
+    cache_key = tuple(sql.text for sql, _ in statements)
+    cached = _FUSED_SQL_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    branches = []
+    typed_binds = []
+    for index, (statement, _) in enumerate(statements):
+        body = _BIND_PARAM_RE.sub(lambda match: f":s{index}_{match.group(1)}", statement.text)
+        branches.append(f"SELECT {index} AS statement_index, to_jsonb(s{index}) AS payload FROM ({body}) s{index}")
+        # Carry each statement's bind types over to its renamed parameters.
+        typed_binds.extend(
+            bindparam(f"s{index}_{name}", type_=bind.type) for name, bind in statement._bindparams.items()
+        )
+    sql = text("\nUNION ALL\n".join(branches)).bindparams(*typed_binds)
+    _FUSED_SQL_CACHE[cache_key] = sql
+    return sql
+
+
+def _run_search_statements_fused(
+    db: Session,
+    statements: list[tuple[Any, dict[str, Any]]],
+    outcome: _SearchOutcome | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Run several search statements in one round-trip and return their rows in input
+    order. If the fused statement fails, each statement is retried on its own so one
+    bad branch only costs its own rows.
+    """
+    params = {
+        f"s{index}_{name}": value
+        for index, (_, statement_params) in enumerate(statements)
+        for name, value in statement_params.items()
+    }
+    try:
+        fused_rows = db.execute(_fused_search_sql(statements), params).all()
+    except SQLAlchemyError as exc:
+        logger.warning("Fused search query failed, retrying statements separately: %s", exc)
+        # The failure aborted the transaction and took its session settings with it.
+        db.rollback()
+        retried_rows = []
+        for statement in statements:
+            # A failing retry rolls back as well, so re-apply the settings every time.
+            _prepare_search_session(db)
+            retried_rows.append(_run_search_statement(db, *statement, outcome))
+        return retried_rows
+    results: list[list[dict[str, Any]]] = [[] for _ in statements]
+    for statement_index, row in fused_rows:
+        results[statement_index].append(row)
+    return results
+
 
 @router.get("/search", response_model=SearchResponse)
 def search(
@@ -1269,7 +1919,7 @@ def search(
     query = q.strip()
     coord = parse_coords(query)
     normalized_query = normalize_search_text(query, replace_ta_marbuta=True)
-    if not normalized_query and coord is None:
+    if len(normalized_query) < _MIN_SEARCH_QUERY_LEN and coord is None:
         return SearchResponse(items=[])
 
     normalized_lower = normalized_query.lower() if normalized_query else ""
@@ -1287,10 +1937,8 @@ def search(
     district_core = _strip_intent_words(normalized_lower, _DISTRICT_INTENT_WORDS)
     road_core = _strip_intent_words(normalized_lower, _ROAD_INTENT_WORDS)
     q_like_lower_district = f"%{district_core}%" if district_core else q_like_lower
-    q_raw_district = district_core or q_raw
     q_raw_lower_district = district_core or q_raw_lower
     q_like_lower_road = f"%{road_core}%" if road_core else q_like_lower
-    q_raw_road = road_core or q_raw
     q_raw_lower_road = road_core or q_raw_lower
 
     per_type_limit = min(limit, 8)
@@ -1298,6 +1946,21 @@ def search(
     plan, block, parcel = parse_parcel_tokens(query)
     intent = _intent_flags(normalized_lower, plan, block, parcel)
 
+    # Typeahead repeats the same normalized query (retyped characters, identical
+    # keystrokes across users); serve those from memory for a short while.
+    cache_key = (
+        normalized_lower,
+        limit,
+        tuple(round(value, 4) for value in viewport) if viewport else None,
+        coord,
+        plan,
+        block,
+        parcel,
+    )
+    cached_response = _SEARCH_RESPONSE_CACHE.get(cache_key)
+    if cached_response is not None:
+        return cached_response
+
     # Use intent-stripped query for both candidate retrieval and scoring when appropriate.
     score_query_lower = normalized_lower
     score_query_tokens = query_tokens
@@ -1314,18 +1977,19 @@ def search(
         index_q_like_lower = q_like_lower_road
         index_q_raw_lower = q_raw_lower_road
 
-    def run_query(sql: Any, params: dict[str, Any], include_bbox: bool = True) -> list[dict[str, Any]]:
-        try:
-            bbox_params = _bbox_params(viewport) if include_bbox else {}
-            return list(db.execute(sql, {**params, **bbox_params}).mappings())
-        except SQLAlchemyError as exc:
-            logger.warning("Search query failed: %s", exc)
-            return []
+    # One to_regclass() round-trip for every table this request may touch.
+    tables_present = _prewarm_tables(db, [*_SEARCH_TABLES, *sorted(_allowed_parcel_tables())])
+
+    def has_table(table_name: str) -> bool:
+        return _table_known(db, table_name, tables_present)
+
+    _prepare_search_session(db)
+    outcome = _SearchOutcome()
 
     scored_rows: dict[str, list[tuple[float, dict[str, Any]]]] = {}
 
     # Prefer unified search index if present (fast + comprehensive).
-    if _table_exists(db, "public.search_index_mat"):
+    if has_table("public.search_index_mat"):
         # Pull more candidates than the final limit so Python-side rescoring (intent/spatial)
         # has headroom, and dedupe doesn't reduce result count.
         candidate_limit = min(max(limit * 5, 50), 200)
@@ -1349,148 +2013,122 @@ def search(
             params["has_viewport"] = 0
             # dummy values to satisfy SQL params
             params.update({"min_lon": 0, "min_lat": 0, "max_lon": 0, "max_lat": 0})
-        rows = run_query(_build_search_index_sql(), params, include_bbox=False)
-        # Rows already include a score; still run through _score_row to add intent + spatial boosts.
-        for row in rows:
-            scored_rows.setdefault(str(row.get("type") or ""), []).append(
-                (_score_row(row, intent, viewport, plan, block, parcel, score_query_lower, score_query_tokens), row)
-            )
+        rows = _run_search_statement(db, _build_search_index_sql(), params, outcome)
+        # Rows already include a score; still run through _score_rows to add intent + spatial boosts.
+        for score, row in _score_rows(
+            rows, intent, viewport, plan, block, parcel, score_query_lower, score_query_tokens
+        ):
+            scored_rows.setdefault(str(row.get("type") or ""), []).append((score, row))
     else:
         # Fallback to legacy multi-query mode
-        if _table_exists(db, "public.planet_osm_point"):
-            rows = run_query(
-                _POI_POINT_SQL,
-                {
-                    "q_like_lower": q_like_lower,
-                    "q_raw": q_raw,
-                    "q_raw_lower": q_raw_lower,
-                    "limit": per_type_limit,
-                    "poi_amenities": poi_amenity_values,
-                },
-            )
-            scored_rows.setdefault("poi", [])
-            for row in rows:
-                scored_rows["poi"].append(
-                    (_score_row(row, intent, viewport, plan, block, parcel, score_query_lower, score_query_tokens), row)
-                )
-
-        if _table_exists(db, "public.planet_osm_polygon"):
-            rows = run_query(
-                _POI_POLYGON_SQL,
-                {
-                    "q_like_lower": q_like_lower,
-                    "q_raw": q_raw,
-                    "q_raw_lower": q_raw_lower,
-                    "limit": per_type_limit,
-                    "poi_amenities": poi_amenity_values,
-                },
-            )
-            scored_rows.setdefault("poi", [])
-            for row in rows:
-                scored_rows["poi"].append(
-                    (_score_row(row, intent, viewport, plan, block, parcel, score_query_lower, score_query_tokens), row)
-                )
-
-        if _table_exists(db, "public.planet_osm_line"):
-            rows = run_query(
-                _build_road_sql(db),
-                {
-                    "q_like_lower": q_like_lower_road,
-                    "q_raw": q_raw_road,
-                    "q_raw_lower": q_raw_lower_road,
-                    "limit": per_type_limit,
-                },
-            )
-            scored_rows["road"] = [
-                (_score_row(row, intent, viewport, plan, block, parcel, score_query_lower, score_query_tokens), row)
-                for row in rows
-            ]
-
-        district_rows: list[dict[str, Any]] = []
-        if _table_exists(db, "public.external_feature"):
-            district_rows.extend(
-                run_query(
-                    _DISTRICT_EXTERNAL_SQL,
-                    {
-                        "q_like_lower": q_like_lower_district,
-                        "q_raw": q_raw_district,
-                        "q_raw_lower": q_raw_lower_district,
-                        "limit": per_type_limit,
-                    },
-                )
-            )
-        if _table_exists(db, "public.planet_osm_polygon"):
-            district_rows.extend(
-                run_query(
-                    _DISTRICT_FALLBACK_SQL,
-                    {
-                        "q_like_lower": q_like_lower_district,
-                        "q_raw": q_raw_district,
-                        "q_raw_lower": q_raw_lower_district,
-                        "limit": per_type_limit,
-                    },
-                )
-            )
-        if district_rows:
-            scored_rows["district"] = [
-                (_score_row(row, intent, viewport, plan, block, parcel, score_query_lower, score_query_tokens), row)
-                for row in district_rows
-            ]
-
-        parcel_tables: list[tuple[str, str, str]] = []
-        safe_active = _canonical_parcel_table(PARCEL_TILE_TABLE)
-        suhail_table = _canonical_parcel_table(SUHAIL_PARCEL_TABLE)
-        allowed_tables = {safe_active, suhail_table}
-        if safe_active in allowed_tables and _table_exists(db, safe_active):
-            prefix, label = _parcel_source_metadata(safe_active)
-            parcel_tables.append((safe_active, prefix, label))
-        if (
-            suhail_table in allowed_tables
-            and safe_active != suhail_table
-            and _table_exists(db, suhail_table)
-        ):
-            prefix, label = _parcel_source_metadata(suhail_table)
-            parcel_tables.append((suhail_table, prefix, label))
-
-        if parcel_tables:
-            include_source_label = len(parcel_tables) > 1
-            parcel_rows: list[dict[str, Any]] = []
-            for table_name, prefix, label in parcel_tables:
-                columns = _table_columns(db, table_name)
-                sql = _parcel_search_sql(
-                    table_name=_safe_identifier(table_name, SUHAIL_PARCEL_TABLE),
-                    columns=columns,
-                    id_prefix=prefix,
-                    include_source_label=include_source_label,
-                )
+        has_line_table = has_table("public.planet_osm_line")
+        parcel_tables = _parcel_search_tables(db, tables_present)
+        column_tables = [table_name for table_name, _, _ in parcel_tables]
+        if has_line_table:
+            column_tables.append("public.planet_osm_line")
+        _prewarm_columns(db, column_tables)
+
+        # Every legacy statement is independent, so collect them all and run them as
+        # one fused round-trip (default) or, when SEARCH_QUERY_CONCURRENCY > 1, in
+        # parallel on worker sessions (opt-in; each worker holds a pool connection).
+        # Each job is (result type, sql, params, score query, score tokens).
+        jobs: list[tuple[str, Any, dict[str, Any], str, list[str]]] = []
+        # Jobs that already ran ahead of the batch, with their rows.
+        finished: list[tuple[tuple[str, Any, dict[str, Any], str, list[str]], list[dict[str, Any]]]] = []
+        # The clamped viewport is the same for every statement; build it once.
+        bbox_params = _bbox_params(viewport)
+        poi_params = {
+            "q_like_lower": q_like_lower,
+            "q_raw_lower": q_raw_lower,
+            "limit": per_type_limit,
+            "poi_amenities": poi_amenity_values,
+        }
+        # Name-only POI scans are skipped for very short queries (category keywords still run).
+        run_poi = len(q_raw_lower) >= _MIN_TRIGRAM_QUERY_LEN or bool(poi_amenity_values)
+        run_poi_polygon = run_poi
+        if run_poi and has_table("public.planet_osm_point"):
+            point_job = ("poi", _POI_POINT_SQL, poi_params, score_query_lower, score_query_tokens)
+            skip_score = settings.SEARCH_POI_POLYGON_SKIP_SCORE
+            if skip_score > 0:
+                point_rows = _run_search_statement(db, _POI_POINT_SQL, {**poi_params, **bbox_params}, outcome)
+                finished.append((point_job, point_rows))
+                # The statement's outer SELECT has no ORDER BY, so find the weakest row.
+                if len(point_rows) >= per_type_limit and min(
+                    float(row["score"] or 0.0) for row in point_rows
+                ) >= skip_score:
+                    run_poi_polygon = False
+            else:
+                jobs.append(point_job)
+        if run_poi_polygon and has_table("public.planet_osm_polygon"):
+            jobs.append(("poi", _POI_POLYGON_SQL, poi_params, score_query_lower, score_query_tokens))
+
+        # Road/district LIKE fallbacks get the same short-query treatment unless the
+        # user asked for that type explicitly ("شارع ..." / "حي ...").
+        run_road = len(q_raw_lower_road) >= _MIN_TRIGRAM_QUERY_LEN or intent["road"]
+        run_district = len(q_raw_lower_district) >= _MIN_TRIGRAM_QUERY_LEN or intent["district"]
+
+        if run_road and has_line_table:
+            road_params = {
+                "q_like_lower": q_like_lower_road,
+                "q_raw_lower": q_raw_lower_road,
+                "limit": per_type_limit,
+            }
+            jobs.append(("road", _build_road_sql(db), road_params, score_query_lower, score_query_tokens))
+
+        district_params = {
+            "q_like_lower": q_like_lower_district,
+            "q_raw_lower": q_raw_lower_district,
+            "limit": per_type_limit,
+        }
+        district_sql = _district_search_sql(
+            has_table("public.external_feature"), has_table("public.planet_osm_polygon")
+        )
+        if run_district and district_sql is not None:
+            jobs.append(("district", district_sql, district_params, score_query_lower, score_query_tokens))
+
+        include_source_label = len(parcel_tables) > 1
+        # A full plan/block/parcel triple gets its own equality statement (index seek)
+        # next to the fuzzy one; the merge dedupes parcels found by both.
+        exact_variants = (False, True) if plan and block and parcel else (False,)
+        for table_name, prefix, label in parcel_tables:
+            parcel_params = {
+                "q_like_lower": q_like_lower,
+                "q_raw_lower": q_raw_lower,
+                "limit": per_type_limit,
+                "plan": plan,
+                "block": block,
+                "parcel": parcel,
+                "source_label": label,
+            }
+            for exact_match in exact_variants:
+                sql = _parcel_search_sql_for_table(db, table_name, prefix, include_source_label, exact_match)
                 if sql is None:
                     continue
-                parcel_rows.extend(
-                    run_query(
-                        sql,
-                        {
-                            "q_like_lower": q_like_lower,
-                            "q_raw": q_raw,
-                            "limit": per_type_limit,
-                            "plan": plan,
-                            "block": block,
-                            "parcel": parcel,
-                            "source_label": label,
-                        },
-                    )
-                )
-            if parcel_rows:
-                scored_rows["parcel"] = [
-                    (_score_row(row, intent, viewport, plan, block, parcel, normalized_lower, query_tokens), row)
-                    for row in parcel_rows
-                ]
+                # Parcels score against the full query: plan/block/parcel numbers are not intent words.
+                jobs.append(("parcel", sql, parcel_params, normalized_lower, query_tokens))
+
+        statements = [(sql, {**params, **bbox_params}) for _, sql, params, _, _ in jobs]
+        if not statements:
+            results = []
+        elif len(statements) == 1:
+            results = [_run_search_statement(db, *statements[0], outcome)]
+        elif settings.SEARCH_QUERY_CONCURRENCY > 1:
+            results = _run_search_statements_concurrently(db, statements, outcome)
+        else:
+            # Sequential mode: one UNION ALL round-trip instead of one per statement.
+            results = _run_search_statements_fused(db, statements, outcome)
+
+        for (row_type, _sql, _params, job_query_lower, job_query_tokens), rows in chain(finished, zip(jobs, results)):
+            scored_rows.setdefault(row_type, []).extend(
+                _score_rows(rows, intent, viewport, plan, block, parcel, job_query_lower, job_query_tokens)
+            )
 
     items: list[SearchItem] = []
     remaining_limit = limit
     if coord is not None and remaining_limit > 0:
         lat, lon = coord
         items.append(
-            SearchItem(
+            SearchItem.model_construct(
                 type="coordinate",
                 id=f"coord:{lat},{lon}",
                 label=f"{lat:.6f}, {lon:.6f}",
@@ -1506,4 +2144,10 @@ def search(
         # For now we keep it None so the user sees the true best matches first.
         items.extend(_merge_global_ranked(scored_rows, remaining_limit, per_type_cap=None))
 
-    return SearchResponse(items=items[:limit])
+    search_response = SearchResponse(items=items[:limit])
+    if outcome.degraded:
+        # Some statements failed or timed out: answer with what we have, but don't
+        # pin it in the response cache.
+        return search_response
+    _SEARCH_RESPONSE_CACHE[cache_key] = search_response
+    return search_response
@@ -1,13 +1,25 @@
+import gzip
+import hashlib
+import logging
+import math
 import os
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Annotated, Any, Callable
 
 import mapbox_vector_tile
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.db.deps import get_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["map"])
 
 SUHAIL_PARCEL_TABLE = "public.suhail_parcels_mat"
@@ -30,6 +42,253 @@ def _empty_mvt(layer_name: str = "parcels") -> bytes:
     return mapbox_vector_tile.encode([{"name": layer_name, "features": []}])
 
 
+_TILE_CACHE_CONTROL = "public, max-age=3600"
+# Deepest zoom a client may request (MapLibre's default maxZoom).
+_MAX_TILE_ZOOM = 22
+
+TileZ = Annotated[int, Path(ge=0, le=_MAX_TILE_ZOOM)]
+TileXY = Annotated[int, Path(ge=0)]
+# Tiles smaller than this are sent uncompressed; gzip framing would outweigh the saving.
+_TILE_GZIP_MIN_BYTES = 1024
+
+_TileEntry = tuple[bytes, str, bytes | None]
+
+
+def _tile_entry_nbytes(entry: _TileEntry) -> int:
+    payload, etag, gzipped = entry
+    return len(payload) + len(etag) + len(gzipped or b"")
+
+
+# Rendered tiles, shared by the worker's threads; values are
+# ``(payload, etag, gzipped_payload)``. Bounded by entry count and total bytes.
+_TILE_CACHE = TTLCache(
+    getattr(settings, "TILE_CACHE_SIZE", 4096),
+    getattr(settings, "TILE_CACHE_TTL_S", 3600.0),
+    max_bytes=getattr(settings, "TILE_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+    sizeof=_tile_entry_nbytes,
+)
+
+
+# Renders in progress, so concurrent misses for one tile share a single query.
+_TILE_INFLIGHT: dict[Any, Future] = {}
+_TILE_INFLIGHT_LOCK = threading.Lock()
+
+
+def clear_tile_cache() -> None:
+    """Drop this process's cached tiles. Used by tests.
+
+    The matview refreshes run as separate jobs and cannot reach this cache;
+    refreshed data shows up once entries expire (TILE_CACHE_TTL_S).
+    """
+    _TILE_CACHE.clear()
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+_WEB_MERCATOR_HALF_M = 20037508.342789244
+# ST_AsMVTGeom keeps geometry within this buffer (of a 4096 extent) around the tile.
+_MVT_BUFFER_FRACTION = 64 / 4096
+
+
+def _lnglat_to_3857(lng: float, lat: float) -> tuple[float, float]:
+    mx = lng * _WEB_MERCATOR_HALF_M / 180.0
+    my = math.log(math.tan(math.radians(90.0 + lat) / 2.0)) * _WEB_MERCATOR_HALF_M / math.pi
+    return mx, my
+
+
+@lru_cache(maxsize=4)
+def _data_bbox_3857(raw: str) -> tuple[float, float, float, float] | None:
+    """Parse ``min_lng,min_lat,max_lng,max_lat`` (EPSG:4326) into EPSG:3857 bounds."""
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(part) for part in raw.split(","))
+    except ValueError:
+        return None
+    if not (-180 <= min_lng < max_lng <= 180 and -85 < min_lat < max_lat < 85):
+        return None
+    return (*_lnglat_to_3857(min_lng, min_lat), *_lnglat_to_3857(max_lng, max_lat))
+
+
+def _tile_bounds_4326(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """``(min_lng, min_lat, max_lng, max_lat)`` of the z/x/y XYZ tile."""
+    n = 2.0**z
+
+    def lat(row: float) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1.0 - 2.0 * row / n))))
+
+    return x / n * 360.0 - 180.0, lat(y + 1), (x + 1) / n * 360.0 - 180.0, lat(y)
+
+
+def _buffered_tile_bounds_3857(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """EPSG:3857 bounds of the z/x/y tile grown by the ST_AsMVTGeom buffer."""
+    size = 2 * _WEB_MERCATOR_HALF_M / 2**z
+    pad = size * _MVT_BUFFER_FRACTION
+    min_x = -_WEB_MERCATOR_HALF_M + x * size - pad
+    max_y = _WEB_MERCATOR_HALF_M - y * size + pad
+    return min_x, max_y - size - 2 * pad, min_x + size + 2 * pad, max_y
+
+
+def _tile_outside_data_bbox(z: int, x: int, y: int) -> bool:
+    """True when the z/x/y tile (plus its MVT buffer) misses TILE_DATA_BBOX entirely."""
+    bbox = _data_bbox_3857(getattr(settings, "TILE_DATA_BBOX", "") or "")
+    if bbox is None:
+        return False
+    tile_min_x, tile_min_y, tile_max_x, tile_max_y = _buffered_tile_bounds_3857(z, x, y)
+    min_x, min_y, max_x, max_y = bbox
+    return tile_max_x < min_x or tile_min_x > max_x or tile_max_y < min_y or tile_min_y > max_y
+
+
+def _unrotated_tile_bounds_3857(
+    z: int, x: int, y: int, deg: float, pivot_lng: float, pivot_lat: float
+) -> tuple[float, float, float, float]:
+    """
+    Bounding box of the (buffered) tile rotated by ``-deg`` around the pivot: the
+    unrotated parcels that ``ST_Rotate(geom, radians(deg), pivot)`` can bring into
+    the tile all overlap it.
+    """
+    min_x, min_y, max_x, max_y = _buffered_tile_bounds_3857(z, x, y)
+    px, py = _lnglat_to_3857(pivot_lng, pivot_lat)
+    cos_a, sin_a = math.cos(math.radians(-deg)), math.sin(math.radians(-deg))
+    xs, ys = [], []
+    for cx, cy in ((min_x, min_y), (min_x, max_y), (max_x, min_y), (max_x, max_y)):
+        dx, dy = cx - px, cy - py
+        xs.append(px + dx * cos_a - dy * sin_a)
+        ys.append(py + dx * sin_a + dy * cos_a)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def _render_once(cache_key: tuple, build: Callable[[], _TileEntry]) -> _TileEntry:
+    """
+    Run ``build`` for ``cache_key`` unless another thread already is; in that case
+    wait for and share its result (or its exception).
+    """
+    with _TILE_INFLIGHT_LOCK:
+        future = _TILE_INFLIGHT.get(cache_key)
+        owner = future is None
+        if owner:
+            future = _TILE_INFLIGHT[cache_key] = Future()
+    if not owner:
+        return future.result()
+    try:
+        entry = build()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _TILE_INFLIGHT_LOCK:
+            _TILE_INFLIGHT.pop(cache_key, None)
+    future.set_result(entry)
+    return entry
+
+
+_TILE_SESSION_SQL = text(
+    """
+    SELECT
+        set_config('work_mem', COALESCE(:work_mem, current_setting('work_mem')), true),
+        set_config(
+            'max_parallel_workers_per_gather',
+            COALESCE(:parallel_workers, current_setting('max_parallel_workers_per_gather')),
+            true
+        )
+    """
+)
+
+
+def _prepare_tile_session(db: Session) -> None:
+    """
+    Apply TILE_WORK_MEM / TILE_MAX_PARALLEL_WORKERS to the tile's transaction.
+    Costs no round-trip when neither is configured.
+    """
+    work_mem = (getattr(settings, "TILE_WORK_MEM", "") or "").strip() or None
+    parallel_workers = getattr(settings, "TILE_MAX_PARALLEL_WORKERS", None)
+    if work_mem is None and parallel_workers is None:
+        return
+    try:
+        db.execute(
+            _TILE_SESSION_SQL,
+            {
+                "work_mem": work_mem,
+                "parallel_workers": None if parallel_workers is None else str(parallel_workers),
+            },
+        )
+    except SQLAlchemyError as exc:
+        logger.warning("Tile session settings not applied: %s", exc)
+        db.rollback()
+
+
+def _cached_tile_response(
+    request: Request,
+    cache_key: tuple,
+    render: Callable[[], bytes | None],
+    *,
+    empty_layer: str | None = None,
+) -> Response:
+    """
+    Serve a tile from the process cache, rendering it with ``render`` on a miss.
+    Concurrent misses for the same tile wait for one render instead of each
+    querying PostGIS.
+
+    ``cache_key`` ends with the tile's ``z, x, y``; addresses outside the XYZ grid
+    get 204 straight away, and tiles outside TILE_DATA_BBOX are answered as empty
+    without running ``render``.
+    Empty tiles become an empty MVT for ``empty_layer``, or 204 when it is None.
+    Responses carry an ETag (MD5 of the body, computed once per render) and a
+    matching If-None-Match gets 304 without touching the database. Larger tiles
+    are gzipped once when cached and sent with Content-Encoding: gzip to clients
+    that accept it.
+    """
+    z, x, y = cache_key[-3:]
+    if x >= 1 << z or y >= 1 << z:
+        # Not a tile in the XYZ grid; nothing to render and nothing worth caching.
+        return Response(status_code=204)
+
+    def build() -> _TileEntry:
+        if _tile_outside_data_bbox(z, x, y):
+            payload = b""
+        else:
+            payload = bytes(render() or b"")
+        if not payload and empty_layer is not None:
+            payload = _empty_mvt(empty_layer)
+        gzipped = None
+        if len(payload) >= _TILE_GZIP_MIN_BYTES:
+            gzipped = gzip.compress(payload, compresslevel=6, mtime=0)
+        entry = (payload, f'"{hashlib.md5(payload).hexdigest()}"', gzipped)
+        _TILE_CACHE[cache_key] = entry
+        return entry
+
+    entry = _TILE_CACHE.get(cache_key) or _render_once(cache_key, build)
+    payload, etag, gzipped = entry
+    if not payload:
+        return Response(status_code=204)
+    headers = {"Cache-Control": _TILE_CACHE_CONTROL, "ETag": etag}
+    if gzipped is not None:
+        headers["Vary"] = "Accept-Encoding"
+        if _accepts_gzip(request.headers.get("accept-encoding")):
+            # Each encoding is a distinct representation, so it needs its own ETag.
+            payload = gzipped
+            headers["ETag"] = f'{etag[:-1]}-gzip"'
+            headers["Content-Encoding"] = "gzip"
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(payload, media_type="application/x-protobuf", headers=headers)
+
+
 # --- Dynamic parcel table proxy (TEST-COMPATIBLE) ---
 def _get_parcel_tile_table() -> str:
     # Prefer raw env so tests that monkeypatch env + reload tiles pass reliably.
@@ -55,8 +314,26 @@ _NON_LANDUSE_PARCEL_TABLES = {
 }
 
 
-_SUHAIL_PARCEL_TILE_SQL = text(
-    f"""
+# Width of one ST_AsMVTGeom grid cell (extent 4096) at zoom 0, in EPSG:3857 metres.
+_MVT_CELL_M_Z0 = 2 * _WEB_MERCATOR_HALF_M / 4096
+
+
+def _tile_simplify_tolerance(z: int, tolerance: float | None) -> float | None:
+    """
+    Drop a simplification tolerance that is finer than the tile's MVT grid.
+
+    ST_AsMVTGeom snaps every vertex to a 4096 grid, so a Douglas-Peucker pass with
+    a smaller tolerance only removes detail the snap removes anyway.
+    """
+    if tolerance is None or tolerance <= _MVT_CELL_M_Z0 / 2**z:
+        return None
+    return tolerance
+
+
+def _suhail_parcel_tile_sql(simplify: bool) -> text:
+    geom_expr = "ST_SimplifyPreserveTopology(geom3857, :simplify_tol)" if simplify else "geom3857"
+    return text(
+        f"""
     WITH tile AS (
       SELECT ST_SetSRID(ST_TileEnvelope(:z,:x,:y), 3857) AS geom3857
     ),
@@ -78,20 +355,9 @@ _SUHAIL_PARCEL_TILE_SQL = text(
         classification,
         area_m2,
         perimeter_m,
-        ST_SimplifyPreserveTopology(geom3857, :simplify_tol) AS geom3857
+        {geom_expr} AS geom3857
       FROM parcel_candidates
     ),
-    clipped AS (
-      SELECT
-        s.id,
-        s.landuse,
-        s.classification,
-        s.area_m2,
-        s.perimeter_m,
-        ST_Intersection(s.geom3857, t.geom3857) AS geom3857
-      FROM simplified s, tile t
-      WHERE ST_Intersects(s.geom3857, t.geom3857)
-    ),
     mvtgeom AS (
       SELECT
         id,
@@ -106,12 +372,16 @@ _SUHAIL_PARCEL_TILE_SQL = text(
           64,
           true
         ) AS geom
-      FROM clipped c, tile t
+      FROM simplified c, tile t
     )
     SELECT ST_AsMVT(mvtgeom, 'parcels', 4096, 'geom') AS tile
     FROM mvtgeom;
     """
-)
+    )
+
+
+_SUHAIL_PARCEL_TILE_SQL = _suhail_parcel_tile_sql(simplify=True)
+_SUHAIL_PARCEL_TILE_SQL_UNSIMPLIFIED = _suhail_parcel_tile_sql(simplify=False)
 
 _SUHAIL_PARCEL_ROT_TILE_SQL = text(
     f"""
@@ -129,8 +399,9 @@ _SUHAIL_PARCEL_ROT_TILE_SQL = text(
         p.area_m2,
         p.perimeter_m,
         ST_Transform(p.geom, 3857) AS geom3857
-      FROM {SUHAIL_PARCEL_TABLE} p, tile t
-      WHERE ST_Transform(p.geom, 3857) && t.geom3857
+      FROM {SUHAIL_PARCEL_TABLE} p
+      WHERE ST_Transform(p.geom, 3857)
+        && ST_MakeEnvelope(:src_min_x, :src_min_y, :src_max_x, :src_max_y, 3857)
     ),
     rotated_parcels AS (
       SELECT
@@ -180,7 +451,21 @@ def _generic_parcel_tile_sql(
     simplify_tol: float | None = None,
     min_area_m2: int | None = None,
 ) -> text:
-    safe_id_col = _safe_column(id_col, "id")
+    # Only the presence of the tolerance/area filter changes the SQL; the values
+    # are bound. Returning one statement per shape keeps the SQL text stable, so
+    # SQLAlchemy reuses its compiled form and psycopg can prepare it server-side.
+    return _generic_parcel_tile_statement(
+        table_name,
+        _safe_column(id_col, "id"),
+        simplify_tol is not None and simplify_tol > 0,
+        min_area_m2 is not None,
+    )
+
+
+@lru_cache(maxsize=64)
+def _generic_parcel_tile_statement(
+    table_name: str, safe_id_col: str, simplify: bool, filter_area: bool
+) -> text:
     if table_name in _NON_LANDUSE_PARCEL_TABLES:
         landuse_col = "NULL::text"
         classification_col = "NULL::text"
@@ -191,10 +476,10 @@ def _generic_parcel_tile_sql(
         landuse_col = "p.landuse"
         classification_col = "p.classification"
     geom_expr = "p.geom3857"
-    if simplify_tol is not None and simplify_tol > 0:
+    if simplify:
         geom_expr = "ST_SimplifyPreserveTopology(p.geom3857, :simplify_tol)"
     area_filter = ""
-    if min_area_m2 is not None:
+    if filter_area:
         area_filter = "AND (p.area_m2 >= :min_area_m2 OR p.area_m2 IS NULL)"
     return text(
         f"""
@@ -202,8 +487,7 @@ def _generic_parcel_tile_sql(
           SELECT ST_SetSRID(ST_TileEnvelope(:z,:x,:y), 3857) AS geom3857
         ),
         tile4326 AS (
-          SELECT ST_Transform(geom3857, 4326) AS geom
-          FROM tile
+          SELECT ST_MakeEnvelope(:min_lng, :min_lat, :max_lng, :max_lat, 4326) AS geom
         ),
         parcel_candidates AS (
           SELECT
@@ -215,7 +499,6 @@ def _generic_parcel_tile_sql(
             ST_Transform(p.geom, 3857) AS geom3857
           FROM {table_name} p, tile4326 t
           WHERE p.geom && t.geom
-            AND ST_Intersects(p.geom, t.geom)
             {area_filter}
         ),
         simplified AS (
@@ -228,17 +511,6 @@ def _generic_parcel_tile_sql(
             {geom_expr} AS geom3857
           FROM parcel_candidates p
         ),
-        clipped AS (
-          SELECT
-            s.id,
-            s.landuse,
-            s.classification,
-            s.area_m2,
-            s.perimeter_m,
-            ST_Intersection(s.geom3857, t.geom3857) AS geom3857
-          FROM simplified s, tile t
-          WHERE ST_Intersects(s.geom3857, t.geom3857)
-        ),
         mvtgeom AS (
           SELECT
             id,
@@ -253,7 +525,7 @@ def _generic_parcel_tile_sql(
               64,
               true
             ) AS geom
-          FROM clipped c, tile t
+          FROM simplified c, tile t
         )
         SELECT ST_AsMVT(mvtgeom, 'parcels', 4096, 'geom') AS tile
         FROM mvtgeom;
@@ -348,7 +620,7 @@ _DISTRICT_LABEL_TILE_SQL = text(
 
 @router.get("/tiles/parcels/{z}/{x}/{y}.pbf")
 @router.get("/v1/tiles/parcels/{z}/{x}/{y}.pbf")
-def parcel_tile(z: int, x: int, y: int, db: Session = Depends(get_db)):
+def parcel_tile(z: TileZ, x: TileXY, y: TileXY, request: Request, db: Session = Depends(get_db)):
     # Resolve parcel table (test- and runtime-safe)
     raw_table = PARCEL_TILE_TABLE or ""
     parcel_table = _safe_identifier(
@@ -359,89 +631,109 @@ def parcel_tile(z: int, x: int, y: int, db: Session = Depends(get_db)):
 
     # ArcGIS mode must be derived from the EFFECTIVE table, not the monkeypatched symbol
     arcgis_mode = "arcgis" in parcel_table.lower()
-    try:
-        if parcel_table in ("public.inferred_parcels_v1", "inferred_parcels_v1"):
-            id_col = "parcel_id"
-        else:
-            id_col = "id"
-        params = {"z": z, "x": x, "y": y}
-        if arcgis_mode:
-            # ArcGIS parcels are authoritative cadastral data:
-            # never aggressively area-filter them, or tiles become empty.
-            simplify_tol, min_area_m2 = _arcgis_tile_generalization(z)
-            tile_sql = _generic_parcel_tile_sql(
-                parcel_table,
-                id_col=id_col,
-                simplify_tol=simplify_tol,
-                min_area_m2=min_area_m2,
-            )
-            if simplify_tol is not None:
-                params["simplify_tol"] = simplify_tol
-            if min_area_m2 is not None:
-                params["min_area_m2"] = min_area_m2
-        else:
-            simplify = z == 16
-            tile_sql = _generic_parcel_tile_sql(
-                parcel_table,
-                id_col=id_col,
-                simplify_tol=simplify_default if simplify else None,
-            )
-            if simplify:
-                params["simplify_tol"] = simplify_default
-        tile_bytes = db.execute(tile_sql, params).scalar()
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"failed to render parcel tile: {exc}")
 
-    payload = bytes(tile_bytes or b"")
-    if not payload:
-        return Response(
-            _empty_mvt("parcels"),
-            media_type="application/x-protobuf",
-            headers={"Cache-Control": "public, max-age=3600"},
-        )
-
-    return Response(
-        payload,
-        media_type="application/x-protobuf",
-        headers={"Cache-Control": "public, max-age=3600"},
+    def render() -> bytes | None:
+        try:
+            if parcel_table in ("public.inferred_parcels_v1", "inferred_parcels_v1"):
+                id_col = "parcel_id"
+            else:
+                id_col = "id"
+            # The 4326 filter box is computed here rather than by reprojecting the
+            # tile envelope in SQL; parallels stay parallels in Web Mercator.
+            min_lng, min_lat, max_lng, max_lat = _tile_bounds_4326(z, x, y)
+            params = {
+                "z": z,
+                "x": x,
+                "y": y,
+                "min_lng": min_lng,
+                "min_lat": min_lat,
+                "max_lng": max_lng,
+                "max_lat": max_lat,
+            }
+            if arcgis_mode:
+                # ArcGIS parcels are authoritative cadastral data:
+                # never aggressively area-filter them, or tiles become empty.
+                simplify_tol, min_area_m2 = _arcgis_tile_generalization(z)
+                simplify_tol = _tile_simplify_tolerance(z, simplify_tol)
+                tile_sql = _generic_parcel_tile_sql(
+                    parcel_table,
+                    id_col=id_col,
+                    simplify_tol=simplify_tol,
+                    min_area_m2=min_area_m2,
+                )
+                if simplify_tol is not None:
+                    params["simplify_tol"] = simplify_tol
+                if min_area_m2 is not None:
+                    params["min_area_m2"] = min_area_m2
+            else:
+                simplify = z == 16 and _tile_simplify_tolerance(z, simplify_default) is not None
+                tile_sql = _generic_parcel_tile_sql(
+                    parcel_table,
+                    id_col=id_col,
+                    simplify_tol=simplify_default if simplify else None,
+                )
+                if simplify:
+                    params["simplify_tol"] = simplify_default
+            _prepare_tile_session(db)
+            return db.execute(tile_sql, params).scalar()
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"failed to render parcel tile: {exc}")
+
+    return _cached_tile_response(
+        request,
+        ("parcels", parcel_table, simplify_default, z, x, y),
+        render,
+        empty_layer="parcels",
     )
 
 
 @router.get("/tiles/suhail/{z}/{x}/{y}.pbf")
 @router.get("/v1/tiles/suhail/{z}/{x}/{y}.pbf")
-def suhail_parcel_tile(z: int, x: int, y: int, db: Session = Depends(get_db)):
-    try:
-        tile_bytes = db.execute(
-            _SUHAIL_PARCEL_TILE_SQL,
-            {"z": z, "x": x, "y": y, "simplify_tol": PARCEL_SIMPLIFY_TOLERANCE_M},
-        ).scalar()
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"failed to render suhail parcel tile: {exc}")
-
-    payload = bytes(tile_bytes or b"")
-    if not payload:
-        return Response(status_code=204)
-
-    return Response(
-        payload,
-        media_type="application/x-protobuf",
-        headers={"Cache-Control": "public, max-age=3600"},
+def suhail_parcel_tile(z: TileZ, x: TileXY, y: TileXY, request: Request, db: Session = Depends(get_db)):
+    simplify_tol = _tile_simplify_tolerance(z, PARCEL_SIMPLIFY_TOLERANCE_M)
+
+    def render() -> bytes | None:
+        try:
+            _prepare_tile_session(db)
+            if simplify_tol is None:
+                return db.execute(
+                    _SUHAIL_PARCEL_TILE_SQL_UNSIMPLIFIED, {"z": z, "x": x, "y": y}
+                ).scalar()
+            return db.execute(
+                _SUHAIL_PARCEL_TILE_SQL,
+                {"z": z, "x": x, "y": y, "simplify_tol": simplify_tol},
+            ).scalar()
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"failed to render suhail parcel tile: {exc}")
+
+    return _cached_tile_response(
+        request, ("suhail", PARCEL_SIMPLIFY_TOLERANCE_M, z, x, y), render
     )
 
 
 @router.get("/tiles/suhail-rot/{z}/{x}/{y}.pbf")
 @router.get("/v1/tiles/suhail-rot/{z}/{x}/{y}.pbf")
 def suhail_parcel_rot_tile(
-    z: int,
-    x: int,
-    y: int,
+    z: TileZ,
+    x: TileXY,
+    y: TileXY,
     deg: float = -20.0,
     pivot_lng: float = 46.67,
     pivot_lat: float = 24.71,
     db: Session = Depends(get_db),
 ):
     # Debug-only CRS validation endpoint; do not use for production calculations.
+    # Rendered on every request: deg/pivot are arbitrary client floats, so caching
+    # these tiles would only push real tiles out of the shared cache.
+    if x >= 1 << z or y >= 1 << z:
+        return Response(status_code=204)
     try:
+        # Candidates are the parcels under the tile rotated back around the
+        # pivot, so parcels that rotate in from outside the tile are included.
+        src_min_x, src_min_y, src_max_x, src_max_y = _unrotated_tile_bounds_3857(
+            z, x, y, deg, pivot_lng, pivot_lat
+        )
+        _prepare_tile_session(db)
         tile_bytes = db.execute(
             _SUHAIL_PARCEL_ROT_TILE_SQL,
             {
@@ -451,6 +743,10 @@ def suhail_parcel_rot_tile(
                 "deg": deg,
                 "pivot_lng": pivot_lng,
                 "pivot_lat": pivot_lat,
+                "src_min_x": src_min_x,
+                "src_min_y": src_min_y,
+                "src_max_x": src_max_x,
+                "src_max_y": src_max_y,
             },
         ).scalar()
     except Exception as exc:
@@ -469,27 +765,20 @@ def suhail_parcel_rot_tile(
 
 @router.get("/tiles/district-labels/{z}/{x}/{y}.pbf")
 @router.get("/v1/tiles/district-labels/{z}/{x}/{y}.pbf")
-def district_labels_tile(z: int, x: int, y: int, db: Session = Depends(get_db)):
+def district_labels_tile(z: TileZ, x: TileXY, y: TileXY, request: Request, db: Session = Depends(get_db)):
     """Vector tiles for district label points."""
-    try:
-        tile_bytes = db.execute(
-            _DISTRICT_LABEL_TILE_SQL, {"z": z, "x": x, "y": y}
-        ).scalar()
-    except Exception as exc:
-        raise HTTPException(
-            status_code=500, detail=f"failed to render district labels tile: {exc}"
-        )
 
-    payload = bytes(tile_bytes or b"")
-    if not payload:
-        return Response(
-            _empty_mvt("district_labels"),
-            media_type="application/x-protobuf",
-            headers={"Cache-Control": "public, max-age=3600"},
-        )
+    def render() -> bytes | None:
+        try:
+            _prepare_tile_session(db)
+            return db.execute(
+                _DISTRICT_LABEL_TILE_SQL, {"z": z, "x": x, "y": y}
+            ).scalar()
+        except Exception as exc:
+            raise HTTPException(
+                status_code=500, detail=f"failed to render district labels tile: {exc}"
+            )
 
-    return Response(
-        payload,
-        media_type="application/x-protobuf",
-        headers={"Cache-Control": "public, max-age=3600"},
+    return _cached_tile_response(
+        request, ("district-labels", z, x, y), render, empty_layer="district_labels"
     )
@@ -0,0 +1,93 @@
+"""In-process TTL/LRU cache shared by the API modules (no external deps)."""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small bounded dict-like cache, safe to share between threads. Entries expire
+    ``ttl`` seconds after being set (never when ``ttl`` is None); the least recently
+    read or written entry is evicted once ``maxsize`` entries are exceeded or, when
+    ``max_bytes`` is given, once the entries' ``sizeof`` total exceeds it. A value
+    larger than ``max_bytes`` on its own is not stored; ``maxsize <= 0`` disables
+    the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        *,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("max_bytes needs a sizeof function")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._store: OrderedDict[Any, tuple[float, Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Total ``sizeof`` of the stored entries (0 without ``max_bytes``)."""
+        return self._nbytes
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return default
+            expires, value, size = entry
+            if time.monotonic() >= expires:
+                del self._store[key]
+                self._nbytes -= size
+                return default
+            # Keep hot keys (e.g. popular typeahead prefixes) clear of eviction.
+            self._store.move_to_end(key)
+            return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        expires = math.inf if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            previous = self._store.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[2]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._store[key] = (expires, value, size)
+            self._nbytes += size
+            while len(self._store) > self.maxsize or (
+                self.max_bytes is not None and self._nbytes > self.max_bytes
+            ):
+                _, (_, _, evicted_size) = self._store.popitem(last=False)
+                self._nbytes -= evicted_size
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self._nbytes = 0
@@ -31,6 +31,25 @@ class Settings:
         "PARCEL_IDENTIFY_TABLE", "public.riyadh_parcels_arcgis_proxy"
     )
     PARCEL_IDENTIFY_GEOM_COLUMN: str = os.getenv("PARCEL_IDENTIFY_GEOM_COLUMN", "geom")
+    # Process-local cache of rendered vector tiles (bytes + ETag), per worker.
+    # Entries expire after TILE_CACHE_TTL_S, matching the tiles' Cache-Control
+    # max-age. ``0`` entries disables the cache. TILE_CACHE_MAX_BYTES caps the
+    # raw + gzipped payloads held per worker (low-zoom parcel tiles can be
+    # hundreds of KB each); least recently used tiles are evicted to fit.
+    TILE_CACHE_SIZE: int = int(os.getenv("TILE_CACHE_SIZE", "4096"))
+    TILE_CACHE_MAX_BYTES: int = int(os.getenv("TILE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    TILE_CACHE_TTL_S: float = float(os.getenv("TILE_CACHE_TTL_S", "3600"))
+    # Optional "min_lng,min_lat,max_lng,max_lat" (EPSG:4326) covering the tile data.
+    # Tiles entirely outside it are answered as empty without querying PostGIS.
+    # Empty (default) renders every requested tile.
+    TILE_DATA_BBOX: str = os.getenv("TILE_DATA_BBOX", "")
+    # Transaction-local planner settings for tile queries (e.g. "64MB", 2). Dense
+    # tiles can sort/hash in memory and use parallel workers; every concurrent
+    # tile may claim them, so size against the pool. Unset keeps server defaults.
+    TILE_WORK_MEM: str = os.getenv("TILE_WORK_MEM", "")
+    TILE_MAX_PARALLEL_WORKERS: int | None = (
+        int(os.getenv("TILE_MAX_PARALLEL_WORKERS")) if os.getenv("TILE_MAX_PARALLEL_WORKERS") else None
+    )
 
     # --- External data & APIs (env-driven) ---
     # ArcGIS (البوابة المكانية) parcels/zoning
@@ -66,6 +85,38 @@ class Settings:
         os.getenv("PARCEL_SIMPLIFY_TOLERANCE_M", "1.0")
     )
 
+    # --- Map search (/v1/search) ---
+    # Run each search statement once at worker startup so the first user query
+    # does not pay for cold index pages. Disable for DB-less local runs.
+    SEARCH_WARMUP_ENABLED: bool = (
+        os.getenv("SEARCH_WARMUP_ENABLED", "true").strip().lower()
+        in {"1", "true", "yes", "on"}
+    )
+    # Max number of legacy search statements (POI, road, district, parcel) run in
+    # parallel, shared across all requests. Each worker opens its own DB session
+    # from the app's connection pool, on top of the request's own connection, so
+    # only raise this when the pool has headroom for it under peak search load.
+    # ``1`` (default) runs all statements as one fused round-trip on the request
+    # session.
+    SEARCH_QUERY_CONCURRENCY: int = int(os.getenv("SEARCH_QUERY_CONCURRENCY", "1"))
+    # Server-side statement_timeout for each parallel search statement, so one slow
+    # table cannot hold the whole response. A cancelled statement contributes no rows
+    # (the response is then served uncached), so this trades completeness for latency.
+    # ``0`` (default) disables the limit.
+    SEARCH_STATEMENT_TIMEOUT_MS: int = int(os.getenv("SEARCH_STATEMENT_TIMEOUT_MS", "0"))
+    # pg_trgm.similarity_threshold for the search ``%`` gates. Higher values let the
+    # trigram GIN scans discard more low-similarity rows before ORDER BY/LIMIT (faster,
+    # fewer typo matches); lower values improve recall. Unset (default) keeps the
+    # server's setting (pg_trgm's own default is 0.3) and skips the settings round-trip.
+    SEARCH_TRGM_THRESHOLD: float | None = (
+        float(os.getenv("SEARCH_TRGM_THRESHOLD")) if os.getenv("SEARCH_TRGM_THRESHOLD") else None
+    )
+    # When > 0, the POI point statement runs first and the POI polygon statement is
+    # skipped if points alone fill the per-type limit with similarity >= this value.
+    # Saves the polygon scan for strong name matches at the cost of running the point
+    # statement ahead of the others. ``0`` (default) keeps all statements together.
+    SEARCH_POI_POLYGON_SKIP_SCORE: float = float(os.getenv("SEARCH_POI_POLYGON_SKIP_SCORE", "0"))
+
     # --- Expansion Advisor normalized tables ---
     EXPANSION_ROADS_TABLE: str = os.getenv("EXPANSION_ROADS_TABLE", "expansion_road_context")
     EXPANSION_PARKING_TABLE: str = os.getenv("EXPANSION_PARKING_TABLE", "expansion_parking_asset")
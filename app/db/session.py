@@ -31,5 +31,19 @@ if os.getenv("DB_DEBUG") == "1":
         selected_host = "unknown"
     print(f"[DB_DEBUG] using {source} database host '{selected_host}'")
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# psycopg 3 prepares a statement server-side once it has run prepare_threshold times on
+# a connection (default 5), so hot static queries (map search, tiles) skip re-planning.
+# DB_PREPARE_THRESHOLD tunes that; "none" disables preparing (e.g. behind a PgBouncer
+# transaction pooler older than 1.21).
+connect_args: dict[str, int | None] = {}
+prepare_threshold = os.getenv("DB_PREPARE_THRESHOLD", "").strip().lower()
+if prepare_threshold:
+    try:
+        is_psycopg = make_url(DATABASE_URL).drivername == "postgresql+psycopg"
+    except Exception:
+        is_psycopg = DATABASE_URL.startswith("postgresql+psycopg://")
+    if is_psycopg:
+        connect_args["prepare_threshold"] = None if prepare_threshold == "none" else int(prepare_threshold)
+
+engine = create_engine(DATABASE_URL, pool_pre_ping=True, connect_args=connect_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -20,7 +20,7 @@ from app.api.health import router as health_router
 from app.api.indices import router as indices_router
 from app.api.ingest import router as ingest_router
 from app.api.metadata import router as metadata_router
-from app.api.search import router as search_router
+from app.api.search import router as search_router, warm_search_statements
 from app.api.restaurant_location import router as restaurant_router
 from app.api.tiles import router as tiles_router
 from app.telemetry import setup_otel_if_configured
@@ -154,6 +154,19 @@ def log_parcel_identify_settings() -> None:
         )
 
 
+@app.on_event("startup")
+def warm_search() -> None:
+    if not settings.SEARCH_WARMUP_ENABLED:
+        return
+    try:
+        with SessionLocal() as db:
+            warmed = warm_search_statements(db)
+    except SQLAlchemyError as exc:
+        logger.warning("Search warm-up failed: %s", exc)
+        return
+    logger.info("Search warm-up ran %s statements", warmed)
+
+
 @app.on_event("startup")
 def log_route_counts() -> None:
     routes = list(app.router.routes)
@@ -20,5 +20,6 @@ def _reset_parcel_tile_table() -> None:
         import app.api.tiles as tiles
 
         tiles.PARCEL_TILE_TABLE = "public.riyadh_parcels_arcgis_proxy"
+        tiles.clear_tile_cache()
     except Exception:
         pass
@@ -0,0 +1,50 @@
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_expires_and_stays_bounded(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache["a"] = None
+    assert "a" in cache and cache["a"] is None
+    now[0] += 10
+    assert "a" not in cache
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    assert len(cache) == 2
+    assert cache.get("a") is None and cache.get("c") == 3
+
+
+def test_ttl_cache_reads_refresh_recency():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache["hot"] = 1
+    cache["cold"] = 2
+    assert cache.get("hot") == 1
+    cache["new"] = 3
+    assert "hot" in cache and "cold" not in cache
+
+
+def test_ttl_cache_evicts_least_recent_entries_to_fit_the_byte_budget():
+    cache = TTLCache(maxsize=100, ttl=10, max_bytes=10, sizeof=len)
+    cache["a"] = b"xxxx"
+    cache["b"] = b"xxxx"
+    assert cache.get("a") == b"xxxx"
+    cache["c"] = b"xxxx"
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.nbytes == 8
+    # Replacing an entry swaps its size rather than adding to it.
+    cache["a"] = b"xx"
+    assert cache.nbytes == 6
+    # A value over the whole budget is not stored (and doesn't flush the rest).
+    cache["huge"] = b"x" * 11
+    assert "huge" not in cache and len(cache) == 2
+    cache.clear()
+    assert cache.nbytes == 0 and len(cache) == 0
+
+
+def test_ttl_cache_with_no_entries_allowed_stores_nothing():
+    cache = TTLCache(maxsize=0, ttl=10)
+    cache["a"] = 1
+    assert "a" not in cache and len(cache) == 0
@@ -34,3 +34,18 @@ def test_does_not_append_sslmode_when_present(monkeypatch):
     monkeypatch.delenv("DATABASE_URL", raising=False)
     monkeypatch.delenv("PGSSLMODE", raising=False)
     importlib.reload(session)
+
+
+def test_prepare_threshold_is_passed_to_psycopg(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql+psycopg://x:y@remote:5432/db")
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "none")
+
+    import app.db.session as session
+
+    session = importlib.reload(session)
+
+    assert session.connect_args == {"prepare_threshold": None}
+
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("DB_PREPARE_THRESHOLD", raising=False)
+    importlib.reload(session)
@@ -133,3 +133,182 @@ def test_parcel_tile_inferred_uses_parcel_id_column(monkeypatch) -> None:
         assert "p.id" not in sql_text
     finally:
         app.dependency_overrides.pop(get_db, None)
+
+
+def test_parcel_tile_repeat_is_served_from_cache_with_etag() -> None:
+    dummy = DummySession(payload=b"parcels")
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        first = client.get("/v1/tiles/parcels/16/0/0.pbf")
+        etag = first.headers["ETag"]
+        dummy.allow_execute = False
+        second = client.get("/v1/tiles/parcels/16/0/0.pbf")
+        revalidated = client.get("/v1/tiles/parcels/16/0/0.pbf", headers={"If-None-Match": etag})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    assert second.status_code == 200
+    assert second.content == b"parcels"
+    assert second.headers["ETag"] == etag
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_parcel_tile_cache_is_keyed_by_table(monkeypatch) -> None:
+    dummy = DummySession(payload=b"parcels")
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        client.get("/v1/tiles/parcels/16/0/0.pbf")
+        dummy.executed = False
+        monkeypatch.setattr(tiles, "PARCEL_TILE_TABLE", "public.inferred_parcels_v1")
+        client.get("/v1/tiles/parcels/16/0/0.pbf")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    assert dummy.executed
+
+
+def test_parcel_tile_outside_data_bbox_skips_the_database(monkeypatch) -> None:
+    dummy = DummySession(payload=b"parcels", allow_execute=False)
+    monkeypatch.setattr(tiles.settings, "TILE_DATA_BBOX", "46.2,24.2,47.3,25.1", raising=False)
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        resp = client.get("/v1/tiles/parcels/16/0/0.pbf")
+        dummy.allow_execute = True
+        x, y = _riyadh_tile()
+        inside = client.get(f"/v1/tiles/parcels/16/{x}/{y}.pbf")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    assert resp.status_code == 200
+    assert resp.content == tiles._empty_mvt("parcels")
+    assert inside.content == b"parcels"
+
+
+def test_large_parcel_tile_is_sent_gzipped_to_clients_that_accept_it() -> None:
+    payload = bytes(range(256)) * 16
+    dummy = DummySession(payload=payload)
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        gzipped = client.get("/v1/tiles/parcels/16/0/0.pbf", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/v1/tiles/parcels/16/0/0.pbf", headers={"Accept-Encoding": "identity"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.content == payload
+    assert "Content-Encoding" not in plain.headers
+    assert plain.content == payload
+    assert plain.headers["ETag"] != gzipped.headers["ETag"]
+    assert "Accept-Encoding" in gzipped.headers["Vary"]
+
+
+def test_concurrent_tile_misses_share_one_render() -> None:
+    import threading
+    import time
+
+    calls = []
+    release = threading.Event()
+
+    def build():
+        calls.append(1)
+        release.wait(5)
+        return (b"tile", '"etag"', None)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(tiles._render_once(("t", 1, 2, 3), build)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(calls) == 1
+    assert results == [(b"tile", '"etag"', None)] * 4
+    assert not tiles._TILE_INFLIGHT
+
+
+def test_tile_session_settings_are_applied_only_when_configured(monkeypatch) -> None:
+    executed = []
+
+    class RecordingSession(DummySession):
+        def execute(self, *args, **kwargs):
+            executed.append(str(args[0]))
+            return super().execute(*args, **kwargs)
+
+    dummy = RecordingSession(payload=b"parcels")
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        client.get("/v1/tiles/parcels/16/0/0.pbf")
+        assert not any("set_config" in sql for sql in executed)
+        monkeypatch.setattr(tiles.settings, "TILE_WORK_MEM", "64MB", raising=False)
+        client.get("/v1/tiles/parcels/16/0/1.pbf")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    assert "set_config('work_mem'" in executed[1]
+    assert dummy.last_params.get("simplify_tol") == 3.0
+
+
+def test_invalid_tile_addresses_are_rejected_before_the_database() -> None:
+    dummy = DummySession(payload=b"parcels", allow_execute=False)
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        off_grid = client.get("/v1/tiles/parcels/2/4/0.pbf")
+        negative = client.get("/v1/tiles/parcels/2/-1/0.pbf")
+        too_deep = client.get("/v1/tiles/suhail/30/0/0.pbf")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    assert off_grid.status_code == 204
+    assert negative.status_code == 422
+    assert too_deep.status_code == 422
+    assert len(tiles._TILE_CACHE) == 0
+
+
+def test_rotated_debug_tiles_bypass_the_tile_cache() -> None:
+    dummy = DummySession(payload=b"rotated")
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        first = client.get("/v1/tiles/suhail-rot/16/0/0.pbf", params={"deg": 12.5})
+        dummy.executed = False
+        second = client.get("/v1/tiles/suhail-rot/16/0/0.pbf", params={"deg": 12.5})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+    assert first.status_code == second.status_code == 200
+    assert second.content == b"rotated"
+    assert second.headers["Cache-Control"] == "no-store"
+    assert dummy.executed
+    assert len(tiles._TILE_CACHE) == 0
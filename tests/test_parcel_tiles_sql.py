@@ -22,3 +22,71 @@ def test_suhail_parcel_tile_sql_contains_expected_fields():
         "ST_Transform(p.geom, 3857) && t.geom3857" in sql
         or "ST_Transform(p.geom,3857) && t.geom3857" in sql
     )
+
+
+def test_generic_parcel_tile_sql_is_reused_across_tolerances():
+    from app.api.tiles import _generic_parcel_tile_sql
+
+    table = "public.riyadh_parcels_arcgis_proxy"
+    first = _generic_parcel_tile_sql(table, simplify_tol=120.0, min_area_m2=50)
+    assert _generic_parcel_tile_sql(table, simplify_tol=60.0, min_area_m2=50) is first
+    assert _generic_parcel_tile_sql(table, simplify_tol=None, min_area_m2=None) is not first
+    assert ":simplify_tol" not in str(_generic_parcel_tile_sql(table, simplify_tol=0))
+
+
+def test_sub_pixel_simplify_tolerance_is_dropped():
+    from app.api.tiles import _SUHAIL_PARCEL_TILE_SQL_UNSIMPLIFIED, _tile_simplify_tolerance
+
+    # One MVT grid cell is ~1.2 m at z13 and ~0.6 m at z14.
+    assert _tile_simplify_tolerance(13, 1.0) is None
+    assert _tile_simplify_tolerance(14, 1.0) == 1.0
+    assert _tile_simplify_tolerance(10, 120.0) == 120.0
+    assert _tile_simplify_tolerance(16, None) is None
+    assert "ST_SimplifyPreserveTopology" not in str(_SUHAIL_PARCEL_TILE_SQL_UNSIMPLIFIED)
+
+
+def test_tile_bounds_4326_match_the_xyz_scheme():
+    from app.api.tiles import _tile_bounds_4326
+
+    min_lng, min_lat, max_lng, max_lat = _tile_bounds_4326(0, 0, 0)
+    assert (min_lng, max_lng) == (-180.0, 180.0)
+    assert abs(max_lat - 85.0511287798) < 1e-9 and abs(min_lat + 85.0511287798) < 1e-9
+    min_lng, min_lat, max_lng, max_lat = _tile_bounds_4326(1, 1, 0)
+    assert (min_lng, min_lat, max_lng) == (0.0, 0.0, 180.0)
+
+
+def test_tile_sql_leaves_clipping_to_st_asmvtgeom():
+    from app.api.tiles import _generic_parcel_tile_sql
+
+    for sql in (
+        str(_SUHAIL_PARCEL_TILE_SQL),
+        str(_generic_parcel_tile_sql("public.riyadh_parcels_arcgis_proxy", simplify_tol=3.0)),
+    ):
+        assert "ST_Intersection(" not in sql
+        assert "ST_Intersects(" not in sql
+        assert "ST_AsMVTGeom(" in sql
+
+
+def test_rotated_tile_candidates_cover_the_back_rotated_tile():
+    import math
+
+    from app.api.tiles import (
+        _buffered_tile_bounds_3857,
+        _lnglat_to_3857,
+        _unrotated_tile_bounds_3857,
+    )
+
+    tile = (15, 20634, 14062)
+    min_x, min_y, max_x, max_y = _buffered_tile_bounds_3857(*tile)
+    assert _unrotated_tile_bounds_3857(*tile, 0.0, 46.67, 24.71) == (min_x, min_y, max_x, max_y)
+
+    # A point rotated by +deg around the pivot lands in the tile centre, so the
+    # unrotated point must fall inside the candidate box.
+    deg = -20.0
+    px, py = _lnglat_to_3857(46.67, 24.71)
+    cx, cy = (min_x + max_x) / 2, (min_y + max_y) / 2
+    a = math.radians(-deg)
+    ux = px + (cx - px) * math.cos(a) - (cy - py) * math.sin(a)
+    uy = py + (cx - px) * math.sin(a) + (cy - py) * math.cos(a)
+    box = _unrotated_tile_bounds_3857(*tile, deg, 46.67, 24.71)
+    assert box[0] <= ux <= box[2] and box[1] <= uy <= box[3]
@@ -0,0 +1,383 @@
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.api import search
+from app.core.config import settings
+from app.db.deps import get_db
+from app.main import app
+
+
+class DummyResult:
+    def __init__(self, scalar_value=None, rows=None):
+        self._scalar = scalar_value
+        self._rows = rows or []
+
+    def scalar(self):
+        return self._scalar
+
+    def mappings(self):
+        return self
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def all(self):
+        return list(self._rows)
+
+
+class DummySession:
+    """Pretends the legacy OSM tables exist and records every search statement."""
+
+    def __init__(self, existing: set[str]) -> None:
+        self.existing = existing
+        self.statements: list[str] = []
+        self.column_lookups = 0
+        self.table_lookups = 0
+        self.worker_sessions = 0
+        self.session_settings: list[dict] = []
+
+    def execute(self, sql, params=None):
+        sql_text = str(sql)
+        if "to_regclass" in sql_text:
+            self.table_lookups += 1
+            if "tables" in (params or {}):
+                return DummyResult(rows=[(name, name in self.existing) for name in params["tables"]])
+            name = (params or {}).get("table_name")
+            return DummyResult(scalar_value=name if name in self.existing else None)
+        if "set_config" in sql_text:
+            self.session_settings.append(dict(params))
+            return DummyResult()
+        if "information_schema.columns" in sql_text:
+            self.column_lookups += 1
+            return DummyResult(rows=[])
+        self.statements.append(sql_text)
+        return DummyResult(rows=[])
+
+    def close(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def _search(dummy: DummySession, q: str, monkeypatch):
+    search.clear_search_catalog_cache()
+
+    def worker_session():
+        dummy.worker_sessions += 1
+        return dummy
+
+    # Concurrent statements open their own sessions; hand them the same dummy.
+    monkeypatch.setattr(search, "db_session", SimpleNamespace(SessionLocal=worker_session))
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        return TestClient(app).get("/v1/search", params={"q": q})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        search.clear_search_catalog_cache()
+
+
+def test_short_query_skips_poi_name_scans(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon"})
+    resp = _search(dummy, "ab", monkeypatch)
+    assert resp.status_code == 200
+    assert not any("FROM planet_osm_point" in sql for sql in dummy.statements)
+
+
+def test_short_query_skips_road_and_district_scans(monkeypatch) -> None:
+    dummy = DummySession(
+        {"public.planet_osm_polygon", "public.planet_osm_line", "public.external_feature"}
+    )
+    resp = _search(dummy, "ab", monkeypatch)
+    assert resp.status_code == 200
+    assert dummy.statements == []
+
+
+def test_short_query_with_road_keyword_still_runs_road_scan(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_line"})
+    resp = _search(dummy, "شارع 10", monkeypatch)
+    assert resp.status_code == 200
+    assert any("FROM planet_osm_line" in sql for sql in dummy.statements)
+
+
+def test_district_sources_share_one_statement(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_polygon", "public.external_feature"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 4)
+    resp = _search(dummy, "النرجس", monkeypatch)
+    assert resp.status_code == 200
+    district_sql = [sql for sql in dummy.statements if "FROM external_feature" in sql]
+    assert len(district_sql) == 1
+    assert "FROM planet_osm_polygon" in district_sql[0]
+
+
+class StrongPointSession(DummySession):
+    """POI point statements return a full page of name matches with the given scores."""
+
+    def __init__(self, existing: set[str], scores: list[float] | None = None) -> None:
+        super().__init__(existing)
+        self.scores = scores
+
+    def execute(self, sql, params=None):
+        result = super().execute(sql, params)
+        if "FROM planet_osm_point" in str(sql):
+            scores = self.scores or [0.9] * params["limit"]
+            rows = [
+                {"type": "poi", "id": f"osm_point:{i}", "label": "Cafe", "subtitle": "cafe",
+                 "lng": 46.7, "lat": 24.7, "min_lng": None, "min_lat": None,
+                 "max_lng": None, "max_lat": None, "score": score}
+                for i, score in enumerate(scores)
+            ]
+            return DummyResult(rows=rows)
+        return result
+
+
+def test_strong_poi_points_skip_the_polygon_scan(monkeypatch) -> None:
+    dummy = StrongPointSession({"public.planet_osm_point", "public.planet_osm_polygon"})
+    monkeypatch.setattr(settings, "SEARCH_POI_POLYGON_SKIP_SCORE", 0.6)
+    resp = _search(dummy, "cafe", monkeypatch)
+    assert resp.status_code == 200
+    assert resp.json()["items"]
+    assert not any("FROM planet_osm_polygon" in sql and "amenity" in sql for sql in dummy.statements)
+
+
+def test_one_weak_poi_point_keeps_the_polygon_scan(monkeypatch) -> None:
+    # Unordered rows: the weak match is not the last one.
+    scores = [0.9, 0.2, 0.9, 0.9, 0.9, 0.9, 0.9, 0.9]
+    dummy = StrongPointSession({"public.planet_osm_point", "public.planet_osm_polygon"}, scores)
+    monkeypatch.setattr(settings, "SEARCH_POI_POLYGON_SKIP_SCORE", 0.6)
+    resp = _search(dummy, "cafe", monkeypatch)
+    assert resp.status_code == 200
+    assert any("FROM planet_osm_polygon" in sql and "amenity" in sql for sql in dummy.statements)
+
+
+class ParcelColumnsSession(DummySession):
+    def execute(self, sql, params=None):
+        if "information_schema.columns" in str(sql):
+            self.column_lookups += 1
+            columns = ("street_name", "plan_number", "block_number", "parcel_number")
+            return DummyResult(rows=[("public", "suhail_parcels_mat", column) for column in columns])
+        return super().execute(sql, params)
+
+
+def test_full_parcel_triple_adds_exact_lookup(monkeypatch) -> None:
+    dummy = ParcelColumnsSession({"public.suhail_parcels_mat"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 4)
+    resp = _search(dummy, "مخطط 123 بلوك 4 قطعة 56", monkeypatch)
+    assert resp.status_code == 200
+    parcel_sql = [sql for sql in dummy.statements if "suhail_parcels_mat" in sql]
+    assert len(parcel_sql) == 2
+    assert sum("plan_number::text = :plan" in sql for sql in parcel_sql) == 1
+
+
+def test_single_character_query_skips_the_database(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon"})
+    resp = _search(dummy, "a-", monkeypatch)
+    assert resp.status_code == 200
+    assert resp.json() == {"items": []}
+    assert dummy.table_lookups == 0
+    assert dummy.statements == []
+
+
+def test_regular_query_runs_poi_scans(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon"})
+    resp = _search(dummy, "cafe", monkeypatch)
+    assert resp.status_code == 200
+    assert any("FROM planet_osm_point" in sql for sql in dummy.statements)
+
+
+def test_warm_search_statements_runs_each_legacy_statement() -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon", "public.external_feature"})
+    search.clear_search_catalog_cache()
+    try:
+        warmed = search.warm_search_statements(dummy)
+    finally:
+        search.clear_search_catalog_cache()
+    # POI point, POI polygon, and both district sources in one statement
+    assert warmed == 3
+    assert len(dummy.statements) == 3
+    assert dummy.table_lookups == 1
+
+
+def test_warm_search_statements_prepares_parcel_sql_in_one_catalog_pass() -> None:
+    dummy = DummySession({"public.planet_osm_line", "public.suhail_parcels_mat"})
+    search.clear_search_catalog_cache()
+    try:
+        search.warm_search_statements(dummy)
+        assert len(search._PARCEL_SQL_CACHE) == 1
+    finally:
+        search.clear_search_catalog_cache()
+    assert dummy.table_lookups == 1
+    assert dummy.column_lookups == 1
+
+
+def test_column_lookups_are_batched_into_one_query(monkeypatch) -> None:
+    dummy = DummySession(
+        {"public.planet_osm_line", "public.suhail_parcels_mat", "public.riyadh_parcels_arcgis_proxy"}
+    )
+    resp = _search(dummy, "king fahd", monkeypatch)
+    assert resp.status_code == 200
+    assert dummy.column_lookups == 1
+
+
+def test_table_lookups_are_batched_into_one_query(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon", "public.planet_osm_line"})
+    resp = _search(dummy, "king fahd", monkeypatch)
+    assert resp.status_code == 200
+    assert dummy.table_lookups == 1
+
+
+def test_missing_tables_are_not_reprobed_on_every_request(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 1)
+    search.clear_search_catalog_cache()
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        client.get("/v1/search", params={"q": "cafe"})
+        client.get("/v1/search", params={"q": "bakery"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        search.clear_search_catalog_cache()
+    assert dummy.table_lookups == 1
+
+
+def test_legacy_statements_run_on_worker_sessions(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon", "public.planet_osm_line"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 4)
+    monkeypatch.setattr(settings, "SEARCH_STATEMENT_TIMEOUT_MS", 1500)
+    resp = _search(dummy, "king fahd", monkeypatch)
+    assert resp.status_code == 200
+    # POI point, POI polygon, road, OSM district fallback; the first runs on the request session.
+    assert dummy.worker_sessions == 3
+    assert len(dummy.statements) == 4
+    assert dummy.session_settings == [{"timeout": "1500ms"}] * 4
+
+
+def test_sequential_mode_fuses_statements_into_one_round_trip(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon", "public.planet_osm_line"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 1)
+    resp = _search(dummy, "king fahd", monkeypatch)
+    assert resp.status_code == 200
+    assert dummy.worker_sessions == 0
+    assert len(dummy.statements) == 1
+    assert dummy.statements[0].count("UNION ALL") == 3
+    # Nothing is configured by default, so no settings round-trip precedes it.
+    assert dummy.session_settings == []
+
+
+def test_configured_trgm_threshold_is_applied_without_a_timeout(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon", "public.planet_osm_line"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "SEARCH_TRGM_THRESHOLD", 0.45)
+    resp = _search(dummy, "king fahd", monkeypatch)
+    assert resp.status_code == 200
+    # Sequential mode sets the trigram threshold but keeps the server's statement timeout.
+    assert dummy.session_settings == [{"trgm_threshold": "0.45"}]
+
+
+def test_repeated_query_is_served_from_response_cache(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 1)
+    search.clear_search_catalog_cache()
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        first = client.get("/v1/search", params={"q": "cafe"})
+        statements_after_first = len(dummy.statements)
+        second = client.get("/v1/search", params={"q": " Cafe "})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        search.clear_search_catalog_cache()
+    assert first.status_code == second.status_code == 200
+    assert statements_after_first > 0
+    assert len(dummy.statements) == statements_after_first
+    assert "Cache-Control" not in second.headers
+
+
+class FailingPoiSession(DummySession):
+    """POI statements fail like a cancelled (timed-out) statement would."""
+
+    def execute(self, sql, params=None):
+        if "FROM planet_osm_point" in str(sql):
+            self.statements.append(str(sql))
+            raise SQLAlchemyError("canceling statement due to statement timeout")
+        return super().execute(sql, params)
+
+
+def test_degraded_response_is_not_cached(monkeypatch) -> None:
+    dummy = FailingPoiSession({"public.planet_osm_point", "public.planet_osm_polygon"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 4)
+    search.clear_search_catalog_cache()
+
+    def worker_session():
+        return dummy
+
+    monkeypatch.setattr(search, "db_session", SimpleNamespace(SessionLocal=worker_session))
+
+    def override_get_db():
+        yield dummy
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        first = client.get("/v1/search", params={"q": "cafe"})
+        statements_after_first = len(dummy.statements)
+        second = client.get("/v1/search", params={"q": "cafe"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        search.clear_search_catalog_cache()
+    assert first.status_code == second.status_code == 200
+    assert len(dummy.statements) > statements_after_first
+
+
+def test_statement_timeout_is_off_by_default(monkeypatch) -> None:
+    dummy = DummySession({"public.planet_osm_point", "public.planet_osm_polygon"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 4)
+    monkeypatch.setattr(settings, "SEARCH_STATEMENT_TIMEOUT_MS", 0)
+    resp = _search(dummy, "cafe", monkeypatch)
+    assert resp.status_code == 200
+    assert dummy.session_settings == []
+
+
+class FailingFusedSession(DummySession):
+    """The fused UNION ALL fails; the statements succeed when run one by one."""
+
+    def __init__(self, existing: set[str]) -> None:
+        super().__init__(existing)
+        self.rollbacks = 0
+
+    def execute(self, sql, params=None):
+        if "UNION ALL" in str(sql) and "statement_index" in str(sql):
+            self.statements.append(str(sql))
+            raise SQLAlchemyError("fused statement failed")
+        return super().execute(sql, params)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def test_failed_fused_statement_is_retried_statement_by_statement(monkeypatch) -> None:
+    dummy = FailingFusedSession({"public.planet_osm_point", "public.planet_osm_polygon", "public.planet_osm_line"})
+    monkeypatch.setattr(settings, "SEARCH_QUERY_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "SEARCH_TRGM_THRESHOLD", 0.45)
+    resp = _search(dummy, "king fahd", monkeypatch)
+    assert resp.status_code == 200
+    assert dummy.rollbacks == 1
+    # The fused attempt, then POI point, POI polygon, road and district on their own.
+    assert len(dummy.statements) == 5
+    # The rollback dropped the threshold; it is re-applied before each retried statement.
+    assert dummy.session_settings == [{"trgm_threshold": "0.45"}] * 5
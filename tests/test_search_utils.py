@@ -1,7 +1,14 @@
+from app.api import search
 from app.api.search import (
+    _AR_FOLD_SQL_FROM,
+    _AR_FOLD_SQL_TO,
     SearchItem,
+    _DISTRICT_EXTERNAL_SQL,
+    _POI_POINT_SQL,
     _bbox_params,
+    _fused_search_sql,
     _merge_round_robin,
+    _parcel_search_sql,
     _parse_viewport_bbox,
     normalize_search_text,
     parse_coords,
@@ -15,6 +22,14 @@ def test_normalize_search_text_arabic_variants():
     assert normalize_search_text("حي، العليا") == "حي العليا"
 
 
+def test_sql_arabic_fold_matches_query_normalization():
+    # The SQL translate() applied to columns must fold exactly like the query side.
+    for src, dst in zip(_AR_FOLD_SQL_FROM, _AR_FOLD_SQL_TO):
+        assert normalize_search_text(f"x{src}x") == f"x{dst}x"
+    assert normalize_search_text("xـx") == "xx"
+    assert len(_AR_FOLD_SQL_FROM) == len(_AR_FOLD_SQL_TO) + 1
+
+
 def test_parse_coords_from_lat_lon():
     assert parse_coords("24.7136,46.6753") == (24.7136, 46.6753)
 
@@ -23,6 +38,12 @@ def test_parse_coords_from_google_maps():
     assert parse_coords("https://www.google.com/maps/@24.7136,46.6753,14z") == (24.7136, 46.6753)
 
 
+def test_parse_coords_prefers_url_forms_over_earlier_bare_pairs():
+    assert parse_coords("/place/100,200/@24.7136,46.6753,14z") == (24.7136, 46.6753)
+    assert parse_coords("https://maps.google.com/?q=24.7,46.6") == (24.7, 46.6)
+    assert parse_coords("999,999") is None
+
+
 def test_parse_parcel_tokens_with_keywords():
     assert parse_parcel_tokens("مخطط 123 بلوك 4 قطعة 56") == ("123", "4", "56")
 
@@ -31,6 +52,37 @@ def test_parse_parcel_tokens_with_pattern():
     assert parse_parcel_tokens("123-4-56") == ("123", "4", "56")
 
 
+def test_parse_parcel_tokens_uses_first_three_digit_runs():
+    assert parse_parcel_tokens("12 34 56 78 90") == ("12", "34", "56")
+    assert parse_parcel_tokens("12 34") == (None, None, None)
+
+
+def test_parcel_search_sql_is_cached_per_column_set():
+    columns = frozenset({"street_name", "plan_number", "block_number", "parcel_number"})
+    first = _parcel_search_sql("public.suhail_parcels_mat", columns, "suhail", False)
+    assert first is not None
+    assert _parcel_search_sql("public.suhail_parcels_mat", frozenset(set(columns)), "suhail", False) is first
+    assert _parcel_search_sql("public.suhail_parcels_mat", columns, "suhail", True) is not first
+
+
+def test_parcel_exact_match_sql_is_a_plain_equality_lookup():
+    columns = frozenset({"street_name", "plan_number", "block_number", "parcel_number"})
+    fuzzy = _parcel_search_sql("public.suhail_parcels_mat", columns, "suhail", False)
+    exact = _parcel_search_sql("public.suhail_parcels_mat", columns, "suhail", False, exact_match=True)
+    assert ":plan" not in fuzzy.text
+    assert "plan_number::text = :plan AND block_number::text = :block" in exact.text
+    assert "LIKE" not in exact.text
+    assert _parcel_search_sql("public.suhail_parcels_mat", frozenset({"plan_number"}), "suhail", False, True) is None
+
+
+def test_fused_search_sql_prefixes_bind_names_per_statement():
+    sql = _fused_search_sql([(_POI_POINT_SQL, {}), (_DISTRICT_EXTERNAL_SQL, {})])
+    assert {"s0_q_raw_lower", "s0_poi_amenities", "s1_q_raw_lower"} <= set(sql._bindparams)
+    assert "q_raw_lower" not in sql._bindparams
+    # ::casts are not bind parameters and must survive the rename.
+    assert "geometry::text" in sql.text
+
+
 def test_merge_round_robin_includes_parcel_when_available():
     parcel_row = {
         "type": "parcel",
@@ -80,3 +132,29 @@ def test_viewport_bbox_is_clamped_to_riyadh():
 def test_viewport_bbox_rejects_webmercator_like_values():
     raw = "4900000,2900000,5000000,3000000"
     assert _parse_viewport_bbox(raw) is None
+
+
+def test_spatial_boosts_vector_path_matches_scalar(monkeypatch):
+    viewport = (46.6, 24.6, 46.9, 24.9)
+    rows = [{"lng": 46.6 + i * 0.02, "lat": 24.65 + i * 0.015} for i in range(12)]
+    rows.append({"lng": None, "lat": 24.7})
+    vector = search._spatial_boosts(rows, viewport)
+    monkeypatch.setattr(search, "_VECTOR_SCORE_MIN_ROWS", len(rows) + 1)
+    assert search._spatial_boosts(rows, viewport) == vector
+    assert vector[0][-1] is False and vector[1][-1] == 0.0
+
+
+def test_search_statements_use_the_compiled_statement_cache():
+    # SQLAlchemy only reuses a compiled statement when it can build a cache key.
+    columns = frozenset({"street_name", "plan_number", "block_number", "parcel_number"})
+    statements = [
+        search._POI_POINT_SQL,
+        search._POI_POLYGON_SQL,
+        _DISTRICT_EXTERNAL_SQL,
+        search._DISTRICT_FALLBACK_SQL,
+        search._DISTRICT_SQL,
+        search._build_search_index_sql(),
+        _parcel_search_sql("public.suhail_parcels_mat", columns, "suhail", False),
+        _fused_search_sql([(_POI_POINT_SQL, {}), (_DISTRICT_EXTERNAL_SQL, {})]),
+    ]
+    assert all(sql._generate_cache_key() is not None for sql in statements)